@@ -10,6 +10,7 @@ from rich.panel import Panel
 from ai_options_trader.portfolio.positions import create_example_portfolio
 from ai_options_trader.portfolio.alpaca_adapter import alpaca_to_portfolio
 from ai_options_trader.llm.scenarios.monte_carlo_v01 import MonteCarloV01, ScenarioAssumptions
+from ai_options_trader.config import load_settings
 from ai_options_trader.utils.settings import safe_load_settings
 
 
@@ -49,6 +50,8 @@ def register_v01(labs_app: typer.Typer) -> None:
                 account_type = "🟡 PAPER"
             
             c.print(f"[cyan]Fetching positions from {account_type} account...[/cyan]")
+            # load_settings is memoized: drop any copy built before the ALPACA_PAPER override
+            load_settings.cache_clear()
             settings = safe_load_settings()
             portfolio = alpaca_to_portfolio(settings)
             
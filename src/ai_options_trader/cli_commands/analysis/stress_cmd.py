@@ -18,6 +18,7 @@ from ai_options_trader.portfolio.stress_test import (
     run_all_stress_tests,
     calculate_pnl_attribution,
 )
+from ai_options_trader.config import load_settings
 from ai_options_trader.utils.settings import safe_load_settings
 
 
@@ -59,6 +60,8 @@ def register_stress(labs_app: typer.Typer) -> None:
                 os.environ["ALPACA_PAPER"] = "true"
                 account_type = "🟡 PAPER"
             
+            # load_settings is memoized: drop any copy built before the ALPACA_PAPER override
+            load_settings.cache_clear()
             settings = safe_load_settings()
             portfolio = alpaca_to_portfolio(settings)
             
@@ -1,19 +1,23 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from operator import attrgetter, itemgetter
 import re
 import os
 import typer
 from rich import print
 from rich.console import Console
 from rich.panel import Panel
-from rich.pretty import Pretty
 from rich.table import Table
-from rich.markdown import Markdown
 
-from ai_options_trader.config import load_settings
-from ai_options_trader.overlay.context import extract_underlyings
-from ai_options_trader.utils.settings import safe_load_settings
+# Settings (pydantic-settings), LLM/altdata helpers and rich.markdown are imported inside the
+# commands that use them, so registering `ticker` and rendering `--help` stays cheap.
+
+# OCC option symbol suffix: YYMMDD + C/P + 8-digit strike.
+_OCC_RE = re.compile(r"\d{6}[CP]\d{8}\Z")
+# Alpaca Position fields read when picking the largest option position.
+_position_symbol_mv = attrgetter("symbol", "market_value")
 
 
 def _fmt_market_cap(val: float | None) -> str:
@@ -37,6 +41,8 @@ def register(ticker_app: typer.Typer) -> None:
         start: str = typer.Option("2011-01-01", "--start", help="Start date YYYY-MM-DD"),
     ):
         """Print a quantitative snapshot for a ticker (returns, vol, drawdown, rel strength)."""
+        from ai_options_trader.config import load_settings
+
         settings = load_settings()
         from ai_options_trader.ticker.snapshot import build_ticker_snapshot
 
@@ -58,34 +64,21 @@ def register(ticker_app: typer.Typer) -> None:
         - ticker quantitative snapshot (Alpaca daily closes)
         - current regimes (macro/liquidity/usd + optional tariff summary)
         """
+        from ai_options_trader.config import load_settings
+
         settings = load_settings()
 
-        # --- Ticker snapshot ---
+        from ai_options_trader.regimes.bundle import build_bundle
         from ai_options_trader.ticker.snapshot import build_ticker_snapshot
 
-        snap = build_ticker_snapshot(settings=settings, ticker=ticker, benchmark=benchmark, start=start)
-
-        # --- Regime context (keep it lightweight / non-leaky) ---
-        from ai_options_trader.macro.signals import build_macro_state
-        from ai_options_trader.macro.regime import classify_macro_regime_from_state
-        from ai_options_trader.funding.signals import build_funding_state
-        from ai_options_trader.usd.signals import build_usd_state
-
-        macro_state = build_macro_state(settings=settings, start_date=start, refresh=refresh)
-        macro_regime = classify_macro_regime_from_state(
-            cpi_yoy=macro_state.inputs.cpi_yoy,
-            payrolls_3m_annualized=macro_state.inputs.payrolls_3m_annualized,
-            inflation_momentum_minus_be5y=macro_state.inputs.inflation_momentum_minus_be5y,
-            real_yield_proxy_10y=macro_state.inputs.real_yield_proxy_10y,
-            z_inflation_momentum_minus_be5y=macro_state.inputs.components.get("z_infl_mom_minus_be5y") if macro_state.inputs.components else None,
-            z_real_yield_proxy_10y=macro_state.inputs.components.get("z_real_yield_proxy_10y") if macro_state.inputs.components else None,
-            use_zscores=True,
-            cpi_target=3.0,
-            infl_thresh=0.0,
-            real_thresh=0.0,
-        )
-        liq_state = build_funding_state(settings=settings, start_date=start, refresh=refresh)
-        usd_state = build_usd_state(settings=settings, start_date=start, refresh=refresh)
+        # Ticker snapshot + regime context (keep it lightweight / non-leaky). These are independent
+        # network pulls, so run them concurrently; the bundle also builds its regimes in parallel.
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            fut_snap = ex.submit(build_ticker_snapshot, settings=settings, ticker=ticker, benchmark=benchmark, start=start)
+            states = build_bundle(settings, start_date=start, refresh=refresh, domains=("macro", "funding", "usd"))
+            snap = fut_snap.result()
+        macro_state, macro_regime = states.macro, states.macro_regime
+        liq_state, usd_state = states.funding, states.usd
 
         regimes = {
             "macro": {"state": macro_state.model_dump(), "regime": macro_regime.__dict__},
@@ -116,10 +109,14 @@ def register(ticker_app: typer.Typer) -> None:
         - company profile (sector/industry/market cap)
         - next earnings date (if available)
         """
+        from ai_options_trader.config import load_settings
+
         settings = load_settings()
         from ai_options_trader.altdata.fmp import build_ticker_dossier
 
         d = build_ticker_dossier(settings=settings, ticker=ticker, days_ahead=int(days_ahead))
+        from rich.pretty import Pretty
+
         Console().print(Panel(Pretty(d, expand_all=True), title=f"Dossier: {ticker.upper()}", expand=False))
 
     @ticker_app.command("news")
@@ -139,6 +136,8 @@ def register(ticker_app: typer.Typer) -> None:
         """
         Build a basic ticker profile + recent news summary.
         """
+        from ai_options_trader.utils.settings import safe_load_settings
+
         settings = safe_load_settings()
         if not settings:
             raise typer.BadParameter("Settings unavailable (missing env/.env).")
@@ -154,14 +153,15 @@ def register(ticker_app: typer.Typer) -> None:
                 positions = []
 
             option_syms: list[tuple[float, str]] = []
-            for p in positions or []:
-                sym = str(getattr(p, "symbol", "") or "").upper()
-                if re.search(r"\d{6}[CP]\d{8}$", sym):
-                    mv = float(getattr(p, "market_value", 0.0) or 0.0)
-                    option_syms.append((abs(mv), sym))
+            for sym, mv in map(_position_symbol_mv, positions or []):
+                sym = str(sym or "").upper()
+                if _OCC_RE.search(sym):
+                    option_syms.append((abs(float(mv or 0.0)), sym))
             if option_syms:
-                top_sym = sorted(option_syms, key=lambda x: x[0], reverse=True)[0][1]
-                underlying = next(iter(extract_underlyings([top_sym])), "")
+                top_sym = max(option_syms, key=itemgetter(0))[1]
+                # OCC root = everything before the YYMMDD[C|P]strike suffix.
+                m = _OCC_RE.search(top_sym)
+                underlying = top_sym[: m.start()] if m else ""
                 ticker = underlying or ticker
 
         if not ticker:
@@ -248,6 +248,8 @@ def register(ticker_app: typer.Typer) -> None:
         
         Uses SEC EDGAR API directly (no API key required).
         """
+        from ai_options_trader.utils.settings import safe_load_settings
+
         settings = safe_load_settings()
         if not settings:
             raise typer.BadParameter("Settings unavailable.")
@@ -315,6 +317,8 @@ def register(ticker_app: typer.Typer) -> None:
         """
         Show earnings history, surprises, and analysis for a ticker.
         """
+        from ai_options_trader.utils.settings import safe_load_settings
+
         settings = safe_load_settings()
         if not settings:
             raise typer.BadParameter("Settings unavailable.")
@@ -411,6 +415,8 @@ def register(ticker_app: typer.Typer) -> None:
         This is the comprehensive research command that pulls together all
         available data sources for a single ticker.
         """
+        from ai_options_trader.utils.settings import safe_load_settings
+
         settings = safe_load_settings()
         if not settings:
             raise typer.BadParameter("Settings unavailable.")
@@ -999,6 +1005,8 @@ Be specific and reference the data provided (analyst estimates, beat rate, price
                 )
                 
                 analysis = resp.choices[0].message.content or ""
+                from rich.markdown import Markdown
+
                 c.print(Panel(Markdown(analysis), title="LLM Analysis", expand=False))
                 
             except Exception as e:
@@ -1,7 +1,9 @@
 """Options moonshot command - high-variance extreme-move scanner."""
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache
 
 import pandas as pd
 import typer
@@ -10,19 +12,46 @@ from rich.panel import Panel
 from rich.table import Table
 
 from ai_options_trader.altdata.fmp import build_ticker_dossier
+from ai_options_trader.cli_commands.shared.symbols import split_symbols
 from ai_options_trader.config import load_settings
-from ai_options_trader.data.alpaca import fetch_option_chain, make_clients, to_candidates
+from ai_options_trader.data.alpaca import make_clients, to_candidates
 from ai_options_trader.data.market import fetch_equity_daily_closes
+from ai_options_trader.data.option_chain_cache import cached_fetch_option_chain
 from ai_options_trader.data.quotes import fetch_stock_last_prices
 from ai_options_trader.execution.alpaca import submit_option_order
 from ai_options_trader.llm.moonshot_theory import llm_moonshot_theory
 from ai_options_trader.options.budget_scan import affordable_options_for_ticker, pick_best_affordable
-from ai_options_trader.options.moonshot import rank_moonshots, rank_moonshots_unconditional
+from ai_options_trader.options.moonshot import (
+    rank_moonshots,
+    rank_moonshots_unconditional,
+    realized_vol_ann,
+)
 from ai_options_trader.options.targets import format_required_move, required_underlying_move_for_profit_pct
 from ai_options_trader.regimes.feature_matrix import build_regime_feature_matrix
 from ai_options_trader.strategies.sleeves import resolve_sleeves
 from ai_options_trader.universe.sp500 import load_sp500_universe
 
+_console = Console()
+
+# (header, add_column kwargs) for the per-candidate contract table in the review loop.
+_CONTRACT_COLUMNS: tuple[tuple[str, dict], ...] = (
+    ("Und", {}),
+    ("Type", {}),
+    ("Contract", {}),
+    ("Exp", {}),
+    ("Strike", {"justify": "right"}),
+    ("Price", {"justify": "right"}),
+    ("Move@5%", {"justify": "right"}),
+    ("Premium", {"justify": "right"}),
+)
+
+
+def _new_contract_table(title: str) -> Table:
+    tbl = Table(title=title)
+    for header, kw in _CONTRACT_COLUMNS:
+        tbl.add_column(header, **kw)
+    return tbl
+
 
 def register_moonshot(options_app: typer.Typer) -> None:
     """Register the moonshot command."""
@@ -31,7 +60,7 @@ def register_moonshot(options_app: typer.Typer) -> None:
     def options_moonshot(
         basket: str = typer.Option("starter", "--basket"),
         ticker: str = typer.Option("", "--ticker", "-t"),
-        tickers: str = typer.Option("", "--tickers"),
+        tickers: str = typer.Option("", "--tickers", help="Comma- or space-separated tickers"),
         sleeves: str = typer.Option("", "--sleeves"),
         catalyst_mode: bool = typer.Option(False, "--catalyst-mode"),
         require_sp500: bool = typer.Option(False, "--require-sp500/--no-require-sp500"),
@@ -50,6 +79,7 @@ def register_moonshot(options_app: typer.Typer) -> None:
         min_price: float = typer.Option(0.05, "--min-price"),
         target_abs_delta: float = typer.Option(0.12, "--target-abs-delta"),
         max_spread_pct: float = typer.Option(0.60, "--max-spread-pct"),
+        refresh_chains: bool = typer.Option(False, "--refresh-chains", help="Bypass the option-chain cache"),
         top: int = typer.Option(10, "--top"),
         cash_usd: float = typer.Option(0.0, "--cash"),
         all_in_threshold_usd: float = typer.Option(50.0, "--all-in-threshold"),
@@ -65,7 +95,7 @@ def register_moonshot(options_app: typer.Typer) -> None:
         """
         Find extreme-move analogs and recommend OTM options (high-variance scanner).
         """
-        console = Console()
+        console = _console
         pb = price_basis.strip().lower()
         if pb not in {"ask", "mid", "last"}:
             pb = "ask"
@@ -80,10 +110,10 @@ def register_moonshot(options_app: typer.Typer) -> None:
         # S&P 500 guardrail
         if require_sp500:
             uni = load_sp500_universe(refresh=False, fmp_api_key=settings.fmp_api_key)
-            allow = {t.strip().upper() for t in uni.tickers}
+            allow = uni.ticker_set
             check = []
             if tickers.strip():
-                check = [t.strip().upper() for t in tickers.split(",") if t.strip()]
+                check = split_symbols(tickers)
             elif ticker.strip():
                 check = [ticker.strip().upper()]
             for t in check:
@@ -130,7 +160,7 @@ def register_moonshot(options_app: typer.Typer) -> None:
                 return DEFAULT_UNIVERSE if name.startswith("d") else STARTER_UNIVERSE
 
         symbols: list[str]
-        sleeve_names = [x.strip() for x in (sleeves or "").replace(",", " ").split() if x.strip()]
+        sleeve_names = split_symbols(sleeves, upper=False)
         if sleeve_names:
             cfgs = resolve_sleeves(sleeve_names)
             all_syms = []
@@ -139,7 +169,7 @@ def register_moonshot(options_app: typer.Typer) -> None:
                 all_syms.extend([t.strip().upper() for t in (uni_syms or []) if t])
             symbols = sorted(set(all_syms))
         elif tickers.strip():
-            symbols = [t.strip().upper() for t in tickers.split(",") if t.strip()]
+            symbols = split_symbols(tickers)
         elif ticker.strip():
             symbols = [ticker.strip().upper()]
         else:
@@ -148,24 +178,19 @@ def register_moonshot(options_app: typer.Typer) -> None:
 
         # Data
         X = build_regime_feature_matrix(settings=settings, start_date=str(start_date), refresh_fred=False)
-        px = fetch_equity_daily_closes(settings=settings, symbols=symbols, start=str(start_date), refresh=False).sort_index().ffill()
+        px = fetch_equity_daily_closes(settings=settings, symbols=symbols, start=str(start_date), refresh=False)
+        # Both price sources already return a date-sorted frame; only pay for the sort copy if not.
+        if not px.index.is_monotonic_increasing:
+            px = px.sort_index()
+        px = px.ffill()
 
         asof = min(pd.to_datetime(X.index.max()), pd.to_datetime(px.index.max()))
-        asof_str = str(pd.to_datetime(asof).date())
-        feat_row = {}
-        try:
-            feat_row = X.loc[pd.to_datetime(asof)].to_dict()
-        except Exception:
-            pass
+        asof_date = asof.date()
+        asof_str = asof_date.isoformat()
+        feat_row = X.loc[asof].to_dict() if asof in X.index else {}
 
-        # Realized vol
-        rv_ann = None
-        try:
-            r = px.pct_change().replace([float("inf"), float("-inf")], pd.NA)
-            rv = r.rolling(max(5, int(vol_lookback_days))).std() * (252.0 ** 0.5)
-            rv_ann = rv.loc[pd.to_datetime(asof)] if pd.to_datetime(asof) in rv.index else rv.iloc[-1]
-        except Exception:
-            pass
+        # Realized vol (single trailing window ending at asof; no full rolling frame)
+        rv_ann = realized_vol_ann(px, asof=asof, lookback_days=max(5, int(vol_lookback_days)))
 
         # Rank moonshots
         ranked = rank_moonshots(
@@ -178,7 +203,7 @@ def register_moonshot(options_app: typer.Typer) -> None:
         # Fallback
         if not ranked:
             console.print(Panel("No candidates, falling back...", title="Fallback", expand=False))
-            for mae, ms in [(min_abs_extreme*0.75, max(25, min_samples)), 
+            for mae, ms in [(min_abs_extreme*0.75, max(25, min_samples)),
                            (min_abs_extreme*0.50, max(20, min_samples//2)),
                            (max(0.05, min_abs_extreme*0.33), max(15, min_samples//3))]:
                 ranked = rank_moonshots(
@@ -198,26 +223,26 @@ def register_moonshot(options_app: typer.Typer) -> None:
                 print("[yellow]No candidates available[/yellow]")
                 raise typer.Exit(code=0)
 
+        # Upper-cased ticker computed once per candidate; reused by the filter, display and review.
+        ranked_up = [(r, r.ticker.upper()) for r in ranked]
+
         # Vol filter
         if rv_ann is not None and len(symbols) > 1:
-            try:
-                v = pd.to_numeric(rv_ann, errors="coerce").dropna()
-                if not v.empty:
-                    keep = set(v.index)
-                    if vol_min_ann > 0:
-                        keep = {t for t in keep if float(v.get(t, 0) or 0) >= vol_min_ann}
-                    if 0 < vol_top_pct < 1:
-                        thr = float(v.quantile(max(0, min(1, 1-vol_top_pct))))
-                        keep = {t for t in keep if float(v.get(t, 0) or 0) >= thr}
-                    filtered = [r for r in ranked if r.ticker.upper() in keep]
-                    if filtered:
-                        ranked = filtered
-            except Exception:
-                pass
+            v = rv_ann.dropna()
+            if not v.empty:
+                mask = pd.Series(True, index=v.index)
+                if vol_min_ann > 0:
+                    mask &= v.ge(float(vol_min_ann))
+                if 0 < vol_top_pct < 1:
+                    mask &= v.ge(float(v.quantile(1 - vol_top_pct)))
+                keep = set(v.index[mask].str.upper())
+                filtered = [ru for ru in ranked_up if ru[1] in keep]
+                if filtered:
+                    ranked_up = filtered
 
         # Display
         cash_lbl = f"cash≈${cash_live:,.2f}" if not catalyst_mode else "cash=ignored"
-        tbl = Table(title=f"Moonshot ({asof.date()} | {horizon_days}d | {cash_lbl})")
+        tbl = Table(title=f"Moonshot ({asof_str} | {horizon_days}d | {cash_lbl})")
         tbl.add_column("Rank", justify="right")
         tbl.add_column("Ticker", style="bold")
         tbl.add_column("Dir")
@@ -228,19 +253,17 @@ def register_moonshot(options_app: typer.Typer) -> None:
         tbl.add_column("extreme", justify="right")
         tbl.add_column("n", justify="right")
 
-        shown = ranked[:max(1, int(top))]
-        for i, r in enumerate(shown, start=1):
-            ex = "—"
+        def _extreme_label(r) -> str:
+            # `extreme_date` is already a Timestamp (see rank_moonshots); no re-parse needed.
             if r.extreme_date and r.extreme_return:
-                ex = f"{pd.to_datetime(r.extreme_date).date()} {100*r.extreme_return:+.1f}%"
-            rv_s = "—"
-            try:
-                if rv_ann is not None:
-                    vv = float(pd.to_numeric(rv_ann.get(r.ticker.upper()), errors="coerce"))
-                    if vv == vv:
-                        rv_s = f"{100*vv:.0f}%"
-            except Exception:
-                pass
+                return f"{r.extreme_date.date()} {100*r.extreme_return:+.1f}%"
+            return "—"
+
+        shown = ranked_up[:max(1, int(top))]
+        for i, (r, tkr_up) in enumerate(shown, start=1):
+            ex = _extreme_label(r)
+            vv = rv_ann.get(tkr_up) if rv_ann is not None else None
+            rv_s = f"{100*vv:.0f}%" if vv is not None and vv == vv else "—"
             tbl.add_row(
                 str(i), str(r.ticker),
                 "CALL" if r.direction == "bullish" else "PUT",
@@ -251,38 +274,68 @@ def register_moonshot(options_app: typer.Typer) -> None:
             )
         console.print(tbl)
 
-        # Contract picker helper
-        def _pick_contract(tkr: str, want: str, target_dt: date | None):
-            chain = fetch_option_chain(data, tkr, feed=settings.alpaca_options_feed)
-            cands = list(to_candidates(chain, tkr))
+        # Option chains: served from the prefetch pool when the review loop warmed them up.
+        chain_prefetch: dict[str, Future] = {}
+
+        def _chain(tkr: str) -> dict:
+            fut = chain_prefetch.get(tkr.upper())
+            if fut is not None:
+                return fut.result()
+            return cached_fetch_option_chain(
+                data, tkr, feed=settings.alpaca_options_feed, refresh=bool(refresh_chains),
+            )
+
+        # Contract picker helper (CLI args converted once, bound as defaults -> fast locals)
+        min_dte, max_dte = int(min_days), int(max_days)
+        min_px, tgt_delta, max_sp = float(min_price), float(target_abs_delta), float(max_spread_pct)
+
+        def _pick_contract(
+            tkr: str,
+            want: str,
+            target_dt: date | None,
+            today: date = asof_date,
+            min_dte: int = min_dte,
+            max_dte: int = max_dte,
+            min_px: float = min_px,
+            tgt_delta: float = tgt_delta,
+            max_sp: float = max_sp,
+        ):
+            cands = to_candidates(_chain(tkr), tkr)
             cap = 1e12
-            
-            if target_dt:
-                today = pd.Timestamp(asof).date()
-                for mind, maxd in [(0, 120), (0, 180)]:
-                    opts = affordable_options_for_ticker(
-                        cands, ticker=tkr, max_premium_usd=cap,
-                        min_dte_days=mind, max_dte_days=maxd,
-                        want=want, price_basis=pb, min_price=float(min_price),
-                        max_spread_pct=float(max_spread_pct), require_delta=True, today=today,
-                    )
-                    opts2 = [o for o in opts if o.expiry >= target_dt]
-                    best = pick_best_affordable(opts2, target_abs_delta=float(target_abs_delta), max_spread_pct=float(max_spread_pct))
-                    if best:
-                        return best
-            
+
+            if not target_dt:
+                opts = affordable_options_for_ticker(
+                    cands, ticker=tkr, max_premium_usd=cap,
+                    min_dte_days=min_dte, max_dte_days=max_dte,
+                    want=want, price_basis=pb, min_price=min_px,
+                    max_spread_pct=max_sp, require_delta=True, today=today,
+                )
+                return pick_best_affordable(opts, target_abs_delta=tgt_delta, max_spread_pct=max_sp)
+
+            # One streaming pass over the widest DTE window; the catalyst windows and the
+            # regular-DTE fallback are all subsets of it, so narrow in memory afterwards.
             opts = affordable_options_for_ticker(
                 cands, ticker=tkr, max_premium_usd=cap,
-                min_dte_days=int(min_days), max_dte_days=int(max_days),
-                want=want, price_basis=pb, min_price=float(min_price),
-                max_spread_pct=float(max_spread_pct), require_delta=True,
-                today=pd.Timestamp(asof).date(),
+                min_dte_days=0, max_dte_days=max(180, max_dte),
+                want=want, price_basis=pb, min_price=min_px,
+                max_spread_pct=max_sp, require_delta=True, today=today,
             )
-            return pick_best_affordable(opts, target_abs_delta=float(target_abs_delta), max_spread_pct=float(max_spread_pct))
+            for maxd in (120, 180):
+                opts2 = [o for o in opts if o.dte_days <= maxd and o.expiry >= target_dt]
+                best = pick_best_affordable(opts2, target_abs_delta=tgt_delta, max_spread_pct=max_sp)
+                if best:
+                    return best
+            opts2 = [o for o in opts if min_dte <= o.dte_days <= max_dte]
+            return pick_best_affordable(opts2, target_abs_delta=tgt_delta, max_spread_pct=max_sp)
+
+        # One FMP dossier fetch per ticker per run (shared by catalyst lookup and theory).
+        @lru_cache(maxsize=256)
+        def _dossier(tkr: str) -> dict:
+            return build_ticker_dossier(settings=settings, ticker=tkr, days_ahead=180)
 
         def _next_earnings(tkr: str) -> date | None:
             try:
-                d = build_ticker_dossier(settings=settings, ticker=tkr, days_ahead=180)
+                d = _dossier(tkr)
                 ne = d.get("next_earnings") if isinstance(d, dict) else None
                 if isinstance(ne, dict) and ne.get("date"):
                     return pd.to_datetime(ne.get("date")).date()
@@ -299,117 +352,128 @@ def register_moonshot(options_app: typer.Typer) -> None:
 
         if review:
             label = "LIVE" if live_ok else "PAPER"
-            n_review = min(int(review_limit), len(ranked))
+            n_review = min(int(review_limit), len(ranked_up))
 
-            for i, r in enumerate(ranked[:n_review], start=1):
-                if remaining_cash <= 0 and cash_live > 0:
-                    console.print(Panel("No cash remaining", title="Budget", expand=False))
-                    break
+            # One batched quote request for every ticker we might review (was one call per candidate).
+            review_tickers = list(dict.fromkeys(u for _, u in ranked_up[:n_review]))
+            last_px_map: dict[str, float] = {}
+            try:
+                last_px_map, _, _ = fetch_stock_last_prices(
+                    settings=settings, symbols=review_tickers,
+                    max_symbols_for_live=max(10, len(review_tickers)),
+                )
+            except Exception:
+                pass
 
-                try:
-                    want = "call" if r.direction == "bullish" else "put"
-                    target_dt = _next_earnings(r.ticker) if catalyst_mode else None
-                    best = _pick_contract(r.ticker, want, target_dt)
-                except Exception as e:
-                    console.print(f"[dim]{i}/{n_review} {r.ticker}: skip ({type(e).__name__})[/dim]")
-                    continue
-
-                if best is None:
-                    console.print(f"[dim]{i}/{n_review} {r.ticker}: no contract[/dim]")
-                    continue
-
-                ex = "—"
-                if r.extreme_date and r.extreme_return:
-                    ex = f"{pd.to_datetime(r.extreme_date).date()} {100*r.extreme_return:+.1f}%"
-
-                console.print(Panel(
-                    f"{i}/{n_review}  {r.ticker}  {'CALL' if r.direction=='bullish' else 'PUT'}  "
-                    f"score={r.score:.3f}  extreme={ex}",
-                    title="Candidate", expand=False,
-                ))
-
-                if with_theory:
-                    try:
-                        dossier = build_ticker_dossier(settings=settings, ticker=r.ticker, days_ahead=180) if catalyst_mode else {}
-                        theory = llm_moonshot_theory(
-                            settings=settings, asof=asof_str, ticker=r.ticker,
-                            direction=r.direction, horizon_days=int(horizon_days),
-                            regime_features=feat_row,
-                            analog_stats={
-                                "samples": r.samples, "q05": r.q05, "q50": r.q50,
-                                "q95": r.q95, "best": r.best, "worst": r.worst,
-                                "extreme_date": r.extreme_date, "extreme_return": r.extreme_return,
-                            },
-                            dossier=dossier,
-                            model=theory_model.strip() or None,
-                            temperature=float(theory_temperature),
-                        )
-                        console.print(Panel(theory, title="Theory", expand=False))
-                    except Exception as e:
-                        console.print(f"[dim]Theory unavailable: {e}[/dim]")
+            # Fetch every review ticker's chain in the background while the user is still
+            # reading / confirming earlier candidates; _chain() waits on these futures.
+            prefetch_pool = ThreadPoolExecutor(max_workers=min(8, max(1, len(review_tickers))))
+            for t in review_tickers:
+                chain_prefetch[t] = prefetch_pool.submit(
+                    cached_fetch_option_chain, data, t,
+                    feed=settings.alpaca_options_feed, refresh=bool(refresh_chains),
+                )
 
-                # Contract table
-                und_px = None
-                try:
-                    if len(symbols) <= 5:
-                        last_px, _, _ = fetch_stock_last_prices(settings=settings, symbols=[best.ticker])
-                        und_px = last_px.get(best.ticker.upper())
-                    if und_px is None and best.ticker in px.columns:
-                        col = px[best.ticker].dropna()
-                        if not col.empty:
-                            und_px = float(col.iloc[-1])
-                except Exception:
-                    pass
+            try:
+                for i, (r, tkr_up) in enumerate(ranked_up[:n_review], start=1):
+                    if remaining_cash <= 0 and cash_live > 0:
+                        console.print(Panel("No cash remaining", title="Budget", expand=False))
+                        break
 
-                move = required_underlying_move_for_profit_pct(
-                    opt_entry_price=float(best.price),
-                    delta=float(best.delta) if best.delta else None,
-                    profit_pct=0.05, underlying_px=und_px, opt_type=str(best.opt_type),
-                )
+                    try:
+                        want = "call" if r.direction == "bullish" else "put"
+                        target_dt = _next_earnings(r.ticker) if catalyst_mode else None
+                        best = _pick_contract(r.ticker, want, target_dt)
+                    except Exception as e:
+                        console.print(f"[dim]{i}/{n_review} {r.ticker}: skip ({type(e).__name__})[/dim]")
+                        continue
+
+                    if best is None:
+                        console.print(f"[dim]{i}/{n_review} {r.ticker}: no contract[/dim]")
+                        continue
+
+                    ex = _extreme_label(r)
+
+                    console.print(Panel(
+                        f"{i}/{n_review}  {r.ticker}  {'CALL' if r.direction=='bullish' else 'PUT'}  "
+                        f"score={r.score:.3f}  extreme={ex}",
+                        title="Candidate", expand=False,
+                    ))
+
+                    if with_theory:
+                        try:
+                            dossier = _dossier(r.ticker) if catalyst_mode else {}
+                            theory = llm_moonshot_theory(
+                                settings=settings, asof=asof_str, ticker=r.ticker,
+                                direction=r.direction, horizon_days=int(horizon_days),
+                                regime_features=feat_row,
+                                analog_stats={
+                                    "samples": r.samples, "q05": r.q05, "q50": r.q50,
+                                    "q95": r.q95, "best": r.best, "worst": r.worst,
+                                    "extreme_date": r.extreme_date, "extreme_return": r.extreme_return,
+                                },
+                                dossier=dossier,
+                                model=theory_model.strip() or None,
+                                temperature=float(theory_temperature),
+                            )
+                            console.print(Panel(theory, title="Theory", expand=False))
+                        except Exception as e:
+                            console.print(f"[dim]Theory unavailable: {e}[/dim]")
+
+                    # Contract table
+                    und_px = None
+                    try:
+                        und_px = last_px_map.get(tkr_up)
+                        if und_px is None and best.ticker in px.columns:
+                            col = px[best.ticker].dropna()
+                            if not col.empty:
+                                und_px = float(col.iloc[-1])
+                    except Exception:
+                        pass
+
+                    move = required_underlying_move_for_profit_pct(
+                        opt_entry_price=float(best.price),
+                        delta=float(best.delta) if best.delta else None,
+                        profit_pct=0.05, underlying_px=und_px, opt_type=str(best.opt_type),
+                    )
 
-                tbl2 = Table(title="Contract")
-                tbl2.add_column("Und")
-                tbl2.add_column("Type")
-                tbl2.add_column("Contract")
-                tbl2.add_column("Exp")
-                tbl2.add_column("Strike", justify="right")
-                tbl2.add_column("Price", justify="right")
-                tbl2.add_column("Move@5%", justify="right")
-                tbl2.add_column("Premium", justify="right")
-                tbl2.add_row(
-                    best.ticker, "CALL" if best.opt_type == "call" else "PUT",
-                    best.symbol, best.expiry.isoformat(),
-                    f"${best.strike:.2f}", f"${best.price:.2f}",
-                    format_required_move(move), f"${best.premium_usd:,.0f}",
-                )
-                console.print(tbl2)
+                    tbl2 = _new_contract_table("Contract")
+                    tbl2.add_row(
+                        best.ticker, "CALL" if best.opt_type == "call" else "PUT",
+                        best.symbol, best.expiry.isoformat(),
+                        f"${best.strike:.2f}", f"${best.price:.2f}",
+                        format_required_move(move), f"${best.premium_usd:,.0f}",
+                    )
+                    console.print(tbl2)
 
-                qty = 1
-                if not catalyst_mode and remaining_cash > 0 and best.premium_usd > 0:
-                    qty = max(1, int(remaining_cash // best.premium_usd)) if all_in else 1
-                est = qty * best.premium_usd
+                    qty = 1
+                    if not catalyst_mode and remaining_cash > 0 and best.premium_usd > 0:
+                        qty = max(1, int(remaining_cash // best.premium_usd)) if all_in else 1
+                    est = qty * best.premium_usd
 
-                if not typer.confirm(f"BUY {qty}x {best.symbol}? [{label}]", default=False):
-                    if typer.confirm("Stop reviewing?", default=False):
-                        break
-                    continue
+                    if not typer.confirm(f"BUY {qty}x {best.symbol}? [{label}]", default=False):
+                        if typer.confirm("Stop reviewing?", default=False):
+                            break
+                        continue
 
-                if not catalyst_mode:
-                    remaining_cash = max(0, remaining_cash - est)
-                    console.print(Panel(f"Reserved ${est:,.2f}, remaining ${remaining_cash:,.2f}", title="Budget", expand=False))
+                    if not catalyst_mode:
+                        remaining_cash = max(0, remaining_cash - est)
+                        console.print(Panel(f"Reserved ${est:,.2f}, remaining ${remaining_cash:,.2f}", title="Budget", expand=False))
 
-                if not execute:
-                    print("[dim]DRY RUN[/dim]: add --execute")
-                    continue
+                    if not execute:
+                        print("[dim]DRY RUN[/dim]: add --execute")
+                        continue
 
-                try:
-                    resp = submit_option_order(
-                        trading=trading, symbol=best.symbol, qty=qty,
-                        side="buy", limit_price=float(best.price), tif="day",
-                    )
-                    print(f"[green]Submitted {label}[/green]: {resp}")
-                except Exception as e:
-                    print(f"[red]Failed[/red]: {e}")
-                    raise typer.Exit(code=2)
+                    try:
+                        resp = submit_option_order(
+                            trading=trading, symbol=best.symbol, qty=qty,
+                            side="buy", limit_price=float(best.price), tif="day",
+                        )
+                        print(f"[green]Submitted {label}[/green]: {resp}")
+                    except Exception as e:
+                        print(f"[red]Failed[/red]: {e}")
+                        raise typer.Exit(code=2)
+            finally:
+                prefetch_pool.shutdown(wait=False, cancel_futures=True)
 
             raise typer.Exit(code=0)
@@ -1,21 +1,53 @@
 """Options scanner commands - bulk scanning across universes."""
 from __future__ import annotations
 
+import heapq
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
 
+import numpy as np
 import typer
 from rich import print
 from rich.console import Console
 from rich.table import Table
 
+from ai_options_trader.cli_commands.shared.symbols import split_symbols
 from ai_options_trader.config import load_settings
-from ai_options_trader.data.alpaca import fetch_option_chain, make_clients, to_candidates
-from ai_options_trader.options.budget_scan import affordable_options_for_ticker, pick_best_affordable
+from ai_options_trader.data.alpaca import make_clients, to_candidates
+from ai_options_trader.data.option_chain_cache import cached_fetch_option_chain
+from ai_options_trader.options.budget_scan import (
+    AffordableOption,
+    affordable_options_for_ticker,
+    pick_best_affordable,
+)
 from ai_options_trader.portfolio.universe import STARTER_UNIVERSE
 from ai_options_trader.universe.sp500 import load_sp500_universe
 
 
+_console = Console()
+
+# (header, add_column kwargs) shared by both under-budget scanners.
+_SCAN_COLUMNS: tuple[tuple[str, dict], ...] = (
+    ("Ticker", {"style": "bold"}),
+    ("Symbol", {"style": "bold"}),
+    ("Type", {}),
+    ("Exp", {}),
+    ("DTE", {"justify": "right"}),
+    ("Strike", {"justify": "right"}),
+    ("Price", {"justify": "right"}),
+    ("Premium", {"justify": "right"}),
+    ("Δ", {"justify": "right"}),
+    ("IV", {"justify": "right"}),
+)
+
+
+def _new_scan_table(title: str) -> Table:
+    tbl = Table(title=title)
+    for header, kw in _SCAN_COLUMNS:
+        tbl.add_column(header, **kw)
+    return tbl
+
+
 def _fmt_price(x: float | None) -> str:
     return f"{float(x):.2f}" if isinstance(x, (int, float)) else "n/a"
 
@@ -24,6 +56,33 @@ def _fmt_pct(x: float | None) -> str:
     return f"{100.0*float(x):.1f}%" if isinstance(x, (int, float)) else "n/a"
 
 
+def _sort_results(results: list[AffordableOption]) -> list[AffordableOption]:
+    """Order by |delta| desc, then premium asc, then ticker (one attribute pass + lexsort)."""
+    if not results:
+        return results
+    d = np.fromiter((-abs(float(o.delta)) for o in results), dtype=np.float64, count=len(results))
+    p = np.fromiter((o.premium_usd for o in results), dtype=np.float64, count=len(results))
+    t = np.array([o.ticker for o in results])
+    return [results[i] for i in np.lexsort((t, p, d))]
+
+
+def _keep_top(heap: list, o: AffordableOption, k: int, seq: int) -> None:
+    """
+    Maintain the best `k` results (same ordering as `_sort_results`) in a bounded min-heap.
+
+    The heap root is the current *worst* kept result: smallest |delta|, then largest premium,
+    then largest ticker (tickers are compared via negated code points, padded so prefixes order
+    correctly). `seq` keeps entries totally ordered without comparing the options themselves.
+    """
+    if k <= 0:
+        return
+    entry = (abs(float(o.delta)), -o.premium_usd, tuple(-ord(ch) for ch in o.ticker) + (1,), seq, o)
+    if len(heap) < k:
+        heapq.heappush(heap, entry)
+    elif entry > heap[0]:
+        heapq.heapreplace(heap, entry)
+
+
 def register_scanners(options_app: typer.Typer) -> None:
     """Register scanner commands."""
 
@@ -42,6 +101,7 @@ def register_scanners(options_app: typer.Typer) -> None:
         workers: int = typer.Option(8, "--workers"),
         refresh_universe: bool = typer.Option(False, "--refresh-universe"),
         max_results: int = typer.Option(200, "--max-results"),
+        refresh_chains: bool = typer.Option(False, "--refresh-chains", help="Bypass the option-chain cache"),
     ):
         """Scan S&P 500 for options under budget (scanner only)."""
         want = "both"
@@ -64,10 +124,11 @@ def register_scanners(options_app: typer.Typer) -> None:
         print(f"[dim]Universe: {len(tickers)} tickers (source={uni.source})[/dim]")
 
         def _scan_one(t: str):
-            chain = fetch_option_chain(data, t, feed=settings.alpaca_options_feed)
-            cands = list(to_candidates(chain, t))
+            chain = cached_fetch_option_chain(
+                data, t, feed=settings.alpaca_options_feed, refresh=bool(refresh_chains),
+            )
             opts = affordable_options_for_ticker(
-                cands, ticker=t, max_premium_usd=float(max_premium_usd),
+                to_candidates(chain, t), ticker=t, max_premium_usd=float(max_premium_usd),
                 min_dte_days=int(min_days), max_dte_days=int(max_days),
                 want=want, price_basis=pb, min_price=float(min_price),
                 max_spread_pct=float(max_spread_pct), require_delta=True,
@@ -75,7 +136,8 @@ def register_scanners(options_app: typer.Typer) -> None:
             )
             return t, pick_best_affordable(opts, target_abs_delta=float(target_abs_delta), max_spread_pct=float(max_spread_pct))
 
-        results = []
+        top: list = []
+        found = 0
         errors = 0
         with ThreadPoolExecutor(max_workers=max(1, int(workers))) as ex:
             futs = {ex.submit(_scan_one, t): t for t in tickers}
@@ -84,26 +146,16 @@ def register_scanners(options_app: typer.Typer) -> None:
                 try:
                     _, best = fut.result()
                     if best:
-                        results.append(best)
+                        found += 1
+                        _keep_top(top, best, int(max_results), found)
                 except Exception as e:
                     errors += 1
                     if errors <= 5:
                         print(f"[dim]{t}: {type(e).__name__}[/dim]")
 
-        results.sort(key=lambda o: (-abs(float(o.delta)), o.premium_usd, o.ticker))
-        shown = results[:max(0, int(max_results))]
-
-        tbl = Table(title=f"S&P 500: options under ${float(max_premium_usd):.0f}")
-        tbl.add_column("Ticker", style="bold")
-        tbl.add_column("Symbol", style="bold")
-        tbl.add_column("Type")
-        tbl.add_column("Exp")
-        tbl.add_column("DTE", justify="right")
-        tbl.add_column("Strike", justify="right")
-        tbl.add_column("Price", justify="right")
-        tbl.add_column("Premium", justify="right")
-        tbl.add_column("Δ", justify="right")
-        tbl.add_column("IV", justify="right")
+        shown = _sort_results([e[-1] for e in top])
+
+        tbl = _new_scan_table(f"S&P 500: options under ${float(max_premium_usd):.0f}")
 
         for o in shown:
             tbl.add_row(
@@ -113,8 +165,8 @@ def register_scanners(options_app: typer.Typer) -> None:
                 f"${o.premium_usd:,.0f}", _fmt_price(o.delta), _fmt_pct(o.iv),
             )
 
-        Console().print(tbl)
-        print(f"[dim]Found: {len(results)}/{len(tickers)} | Errors: {errors}[/dim]")
+        _console.print(tbl)
+        print(f"[dim]Found: {found}/{len(tickers)} | Errors: {errors}[/dim]")
 
     @options_app.command("etf-under-budget")
     def etf_under_budget(
@@ -128,8 +180,9 @@ def register_scanners(options_app: typer.Typer) -> None:
         target_abs_delta: float = typer.Option(0.30, "--target-abs-delta"),
         max_spread_pct: float = typer.Option(0.30, "--max-spread-pct"),
         workers: int = typer.Option(6, "--workers"),
-        tickers: str = typer.Option("", "--tickers"),
+        tickers: str = typer.Option("", "--tickers", help="Comma- or space-separated tickers"),
         max_results: int = typer.Option(50, "--max-results"),
+        refresh_chains: bool = typer.Option(False, "--refresh-chains", help="Bypass the option-chain cache"),
     ):
         """Scan ETF universe for options under budget."""
         want = "both"
@@ -143,7 +196,7 @@ def register_scanners(options_app: typer.Typer) -> None:
             pb = "ask"
 
         if tickers.strip():
-            uni = [t.strip().upper() for t in tickers.split(",") if t.strip()]
+            uni = split_symbols(tickers)
         else:
             uni = [t.strip().upper() for t in STARTER_UNIVERSE.basket_equity]
 
@@ -151,10 +204,11 @@ def register_scanners(options_app: typer.Typer) -> None:
         _, data = make_clients(settings)
 
         def _scan_one(t: str):
-            chain = fetch_option_chain(data, t, feed=settings.alpaca_options_feed)
-            cands = list(to_candidates(chain, t))
+            chain = cached_fetch_option_chain(
+                data, t, feed=settings.alpaca_options_feed, refresh=bool(refresh_chains),
+            )
             opts = affordable_options_for_ticker(
-                cands, ticker=t, max_premium_usd=float(max_premium_usd),
+                to_candidates(chain, t), ticker=t, max_premium_usd=float(max_premium_usd),
                 min_dte_days=int(min_days), max_dte_days=int(max_days),
                 want=want, price_basis=pb, min_price=float(min_price),
                 max_spread_pct=float(max_spread_pct), require_delta=True,
@@ -162,7 +216,8 @@ def register_scanners(options_app: typer.Typer) -> None:
             )
             return t, pick_best_affordable(opts, target_abs_delta=float(target_abs_delta), max_spread_pct=float(max_spread_pct))
 
-        results = []
+        top: list = []
+        found = 0
         errors = 0
         with ThreadPoolExecutor(max_workers=max(1, int(workers))) as ex:
             futs = {ex.submit(_scan_one, t): t for t in uni}
@@ -171,26 +226,16 @@ def register_scanners(options_app: typer.Typer) -> None:
                 try:
                     _, best = fut.result()
                     if best:
-                        results.append(best)
+                        found += 1
+                        _keep_top(top, best, int(max_results), found)
                 except Exception as e:
                     errors += 1
                     if errors <= 5:
                         print(f"[dim]{t}: {type(e).__name__}[/dim]")
 
-        results.sort(key=lambda o: (-abs(float(o.delta)), o.premium_usd, o.ticker))
-        shown = results[:max(0, int(max_results))]
-
-        tbl = Table(title=f"ETF options under ${float(max_premium_usd):.0f}")
-        tbl.add_column("Ticker", style="bold")
-        tbl.add_column("Symbol", style="bold")
-        tbl.add_column("Type")
-        tbl.add_column("Exp")
-        tbl.add_column("DTE", justify="right")
-        tbl.add_column("Strike", justify="right")
-        tbl.add_column("Price", justify="right")
-        tbl.add_column("Premium", justify="right")
-        tbl.add_column("Δ", justify="right")
-        tbl.add_column("IV", justify="right")
+        shown = _sort_results([e[-1] for e in top])
+
+        tbl = _new_scan_table(f"ETF options under ${float(max_premium_usd):.0f}")
 
         for o in shown:
             tbl.add_row(
@@ -200,5 +245,5 @@ def register_scanners(options_app: typer.Typer) -> None:
                 f"${o.premium_usd:,.0f}", _fmt_price(o.delta), _fmt_pct(o.iv),
             )
 
-        Console().print(tbl)
-        print(f"[dim]Found: {len(results)}/{len(uni)} | Errors: {errors}[/dim]")
+        _console.print(tbl)
+        print(f"[dim]Found: {found}/{len(uni)} | Errors: {errors}[/dim]")
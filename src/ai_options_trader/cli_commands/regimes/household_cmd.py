@@ -6,31 +6,206 @@ Based on MMT sectoral balances: S = (G-T) + I + NX
 """
 from __future__ import annotations
 
+import time
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable
+
 import typer
-from rich import print
-from rich.panel import Panel
-from rich.table import Table
+
+from ai_options_trader.cli_commands.shared.json_out import write_json_stdout
+from ai_options_trader.config import load_settings
+from ai_options_trader.household.regime import classify_household_regime
+from ai_options_trader.household.signals import build_household_state, build_sectoral_balances
+
+
+@lru_cache(maxsize=4)
+def _household_state(start: str, refresh: bool):
+    """FRED-backed household state, shared by `snapshot` and `debt` within one process."""
+    return build_household_state(settings=load_settings(), start_date=start, refresh=refresh)
+
+
+@lru_cache(maxsize=4)
+def _sectoral(start: str, refresh: bool):
+    """Sectoral balances keyed like `_household_state`."""
+    return build_sectoral_balances(settings=load_settings(), start_date=start, refresh=refresh)
+
+
+_DASH = "—"
+
+
+def _formatter(spec: str) -> Callable[[float | None], str]:
+    """Bind a pre-parsed `str.format` for `spec`, rendering None as a dash."""
+    fmt = spec.format
+
+    def _f(val: float | None) -> str:
+        return _DASH if val is None else fmt(val)
+
+    return _f
+
+
+# Display formatters (all None -> "—").
+_fmt_pct = _formatter("{:+.2f}%")   # signed percentage
+_fmt_z = _formatter("{:+.2f}σ")     # z-score
+_fmt1pct = _formatter("{:.1f}%")
+_fmt2pct = _formatter("{:.2f}%")
+_fmt1 = _formatter("{:.1f}")
+_fmt2 = _formatter("{:.2f}")
+
+
+@lru_cache(maxsize=4)
+def _sorted_keys(schema: frozenset[str]) -> tuple[str, ...]:
+    """Display order for a feature schema (stable across runs, so sorted once)."""
+    return tuple(sorted(schema))
+
+
+def _interp(
+    z: float | None,
+    *,
+    hi: tuple[float, str] = (1.0, "Elevated burden"),
+    lo: tuple[float, str] = (-1.0, "Low burden"),
+    default: str = "Normal",
+) -> str:
+    """Label a z-score: `hi[1]` at/above `hi[0]`, `lo[1]` at/below `lo[0]`, else `default`."""
+    if z is None:
+        return default
+    if z >= hi[0]:
+        return hi[1]
+    if z <= lo[0]:
+        return lo[1]
+    return default
+
+
+# Main snapshot panel; filled via `format_map` from `_SNAPSHOT_FIELDS` + regime/asof/sectoral text.
+_SNAPSHOT_TEMPLATE = "\n".join([
+    "[b]Regime:[/b] {label}",
+    "[b]As of:[/b] {asof}",
+    "",
+    "[dim]{description}[/dim]",
+    "{sectoral}",
+    "[bold cyan]Wealth Metrics[/bold cyan]",
+    "  Net Worth YoY:       {net_worth_yoy}  (z={z_net_worth_yoy})",
+    "  Real Net Worth YoY:  {net_worth_real_yoy}",
+    "  Savings Rate:        {savings_rate}  (z={z_savings_rate})",
+    "",
+    "[bold cyan]Debt Metrics[/bold cyan]",
+    "  Debt Service Ratio:  {debt_service_ratio}  (z={z_debt_service})",
+    "  Consumer Credit YoY: {consumer_credit_yoy}  (z={z_consumer_credit_yoy})",
+    "  Revolving Cred YoY:  {revolving_credit_yoy}",
+    "  Mortgage Delinq:     {mortgage_delinquency}",
+    "",
+    "[bold cyan]Behavioral Metrics[/bold cyan]",
+    "  Consumer Sentiment:  {consumer_sentiment}  (z={z_consumer_sentiment})",
+    "  M2 Velocity:         {m2_velocity}  (z={z_m2_velocity})",
+    "  Real DPI YoY:        {real_dpi_yoy}  (z={z_real_dpi_yoy})",
+    "  Retail Sales YoY:    {retail_sales_yoy}  (z={z_retail_sales_yoy})",
+    "",
+    "[bold cyan]Composite Scores[/bold cyan]",
+    "  Wealth Score:        {wealth_score}",
+    "  Debt Stress Score:   {debt_stress_score}",
+    "  Behavioral Score:    {behavioral_score}",
+    "  [b]Prosperity Score:[/b]  {prosperity_score}",
+    "",
+])
+
+# `household sectoral` panel body; only the as-of date and the four balances vary per call.
+_SECTORAL_TEMPLATE = (
+    "[b]MMT Sectoral Balances Identity[/b]\n"
+    "S = (G - T) + I + NX\n\n"
+    "Where:\n"
+    "  S   = Private Sector Savings\n"
+    "  G-T = Government Deficit\n"
+    "  I   = Net Investment\n"
+    "  NX  = Net Exports\n\n"
+    "[b]As of:[/b] {asof}\n\n"
+    "[bold cyan]Current Values (% of GDP)[/bold cyan]\n"
+    "  Government Deficit (G-T): {g}\n"
+    "  Net Exports (NX):         {nx}\n"
+    "  Private Investment (I):   {i}\n"
+    "  [b]Private Balance (S):[/b]     {s}\n\n"
+    "[dim]Key insight: Government deficits necessarily create private surpluses.[/dim]\n"
+    "[dim]The question is WHERE they accumulate (households vs corporations)[/dim]\n"
+    "[dim]and what BEHAVIOR they drive (saving, spending, or deleveraging).[/dim]"
+)
 
 
-def _fmt(val: float | None, decimals: int = 2, suffix: str = "") -> str:
-    """Format a float value for display."""
-    if val is None:
-        return "—"
-    return f"{val:.{decimals}f}{suffix}"
+# (template field, HouseholdInputs attribute, formatter)
+_SNAPSHOT_FIELDS = (
+    ("net_worth_yoy", "net_worth_yoy_pct", _fmt_pct),
+    ("z_net_worth_yoy", "z_net_worth_yoy", _fmt_z),
+    ("net_worth_real_yoy", "net_worth_real_yoy_pct", _fmt_pct),
+    ("savings_rate", "savings_rate", _fmt1pct),
+    ("z_savings_rate", "z_savings_rate", _fmt_z),
+    ("debt_service_ratio", "debt_service_ratio", _fmt1pct),
+    ("z_debt_service", "z_debt_service", _fmt_z),
+    ("consumer_credit_yoy", "consumer_credit_yoy_pct", _fmt_pct),
+    ("z_consumer_credit_yoy", "z_consumer_credit_yoy", _fmt_z),
+    ("revolving_credit_yoy", "revolving_credit_yoy_pct", _fmt_pct),
+    ("mortgage_delinquency", "mortgage_delinquency_rate", _fmt2pct),
+    ("consumer_sentiment", "consumer_sentiment", _fmt1),
+    ("z_consumer_sentiment", "z_consumer_sentiment", _fmt_z),
+    ("m2_velocity", "m2_velocity", _fmt2),
+    ("z_m2_velocity", "z_m2_velocity", _fmt_z),
+    ("real_dpi_yoy", "real_dpi_yoy_pct", _fmt_pct),
+    ("z_real_dpi_yoy", "z_real_dpi_yoy", _fmt_z),
+    ("retail_sales_yoy", "retail_sales_yoy_pct", _fmt_pct),
+    ("z_retail_sales_yoy", "z_retail_sales_yoy", _fmt_z),
+    ("wealth_score", "wealth_score", _fmt_z),
+    ("debt_stress_score", "debt_stress_score", _fmt_z),
+    ("behavioral_score", "behavioral_score", _fmt_z),
+    ("prosperity_score", "household_prosperity_score", _fmt_z),
+)
 
 
-def _fmt_pct(val: float | None) -> str:
-    """Format a percentage value."""
-    if val is None:
-        return "—"
-    return f"{val:+.2f}%"
+# LLM snapshot payload: (payload key, HouseholdInputs attribute), read in one attrgetter call.
+_LLM_SNAPSHOT_FIELDS = (
+    # Wealth
+    ("net_worth_yoy_pct", "net_worth_yoy_pct"),
+    ("net_worth_real_yoy_pct", "net_worth_real_yoy_pct"),
+    ("savings_rate", "savings_rate"),
+    ("z_savings_rate", "z_savings_rate"),
+    # Debt
+    ("debt_service_ratio", "debt_service_ratio"),
+    ("z_debt_service", "z_debt_service"),
+    ("consumer_credit_yoy_pct", "consumer_credit_yoy_pct"),
+    # Behavior
+    ("consumer_sentiment", "consumer_sentiment"),
+    ("z_consumer_sentiment", "z_consumer_sentiment"),
+    ("m2_velocity", "m2_velocity"),
+    ("z_m2_velocity", "z_m2_velocity"),
+    # Composites
+    ("wealth_score", "wealth_score"),
+    ("debt_stress_score", "debt_stress_score"),
+    ("behavioral_score", "behavioral_score"),
+    ("prosperity_score", "household_prosperity_score"),
+)
+_LLM_SNAPSHOT_KEYS = tuple(k for k, _ in _LLM_SNAPSHOT_FIELDS)
+_get_llm_snapshot = attrgetter(*(a for _, a in _LLM_SNAPSHOT_FIELDS))
 
 
-def _fmt_z(val: float | None) -> str:
-    """Format a z-score value."""
-    if val is None:
-        return "—"
-    return f"{val:+.2f}σ"
+def _sectoral_triple(sb) -> dict[str, float | None]:
+    """Sectoral balance fields for the LLM payload (all None when unavailable)."""
+    if not sb:
+        return {"govt_deficit_pct_gdp": None, "net_exports_pct_gdp": None, "private_balance_pct_gdp": None}
+    return {
+        "govt_deficit_pct_gdp": sb.govt_deficit_pct_gdp,
+        "net_exports_pct_gdp": sb.net_exports_pct_gdp,
+        "private_balance_pct_gdp": sb.private_balance_pct_gdp,
+    }
+
+
+# Deferred `--llm` dependencies: (llm_analyze_regime, Markdown), resolved on first use.
+_LLM_TOOLS = None
+
+
+def _llm_tools():
+    """Import the LLM analyst + Rich Markdown once; they pull in heavy SDKs not needed otherwise."""
+    global _LLM_TOOLS
+    if _LLM_TOOLS is None:
+        from rich.markdown import Markdown
+        from ai_options_trader.llm.core.analyst import llm_analyze_regime
+        _LLM_TOOLS = (llm_analyze_regime, Markdown)
+    return _LLM_TOOLS
 
 
 def _run_household_snapshot(
@@ -39,21 +214,17 @@ def _run_household_snapshot(
     llm: bool = False,
     features: bool = False,
     json_output: bool = False,
+    verbose: bool = False,
 ):
     """Shared implementation for household snapshot."""
-    from ai_options_trader.config import load_settings
-    from ai_options_trader.household.signals import build_household_state
-    from ai_options_trader.household.regime import classify_household_regime
-    
-    settings = load_settings()
-    state = build_household_state(settings=settings, start_date=start, refresh=refresh)
+    state = _household_state(start, refresh)
     regime = classify_household_regime(state.inputs)
     inp = state.inputs
     
+    # Fail-fast modes: --json and --features return before any panel text or Rich import.
     # JSON output mode
     if json_output:
-        import json
-        from dataclasses import asdict
+        components = inp.components if isinstance(inp.components, dict) else {}
         output = {
             "asof": state.asof,
             "regime": {
@@ -64,10 +235,7 @@ def _run_household_snapshot(
                 "market_implications": regime.market_implications,
             },
             "inputs": {
-                k: v for k, v in (
-                    inp.components if isinstance(inp.components, dict) else {}
-                ).items()
-            } | {
+                **components,
                 "savings_rate": inp.savings_rate,
                 "debt_service_ratio": inp.debt_service_ratio,
                 "consumer_sentiment": inp.consumer_sentiment,
@@ -84,11 +252,15 @@ def _run_household_snapshot(
                 "private_balance_pct_gdp": inp.sectoral.private_balance_pct_gdp,
                 "notes": inp.sectoral.notes,
             }
-        print(json.dumps(output, indent=2, default=str))
+        write_json_stdout(output, default=str)
         return
     
+    # Rich is only loaded for human-facing output (not for --json).
+    from rich import print
+    
     # Features output mode
     if features:
+        from rich.table import Table
         from ai_options_trader.household.features import household_feature_vector
         vec = household_feature_vector(state, regime)
         
@@ -96,13 +268,18 @@ def _run_household_snapshot(
         tbl.add_column("Feature", style="cyan")
         tbl.add_column("Value", justify="right")
         
-        for k, v in sorted(vec.features.items()):
-            tbl.add_row(k, f"{v:.4f}" if isinstance(v, float) else str(v))
+        # Feature values are plain floats (see `add_feature`), so an identity type check suffices.
+        feats = vec.features
+        for k in _sorted_keys(frozenset(feats)):
+            v = feats[k]
+            tbl.add_row(k, f"{v:.4f}" if type(v) is float else str(v))
         
         print(tbl)
         return
     
     # Standard output
+    from rich.panel import Panel
+    
     # Sectoral balances context
     sectoral_text = ""
     if inp.sectoral and inp.sectoral.govt_deficit_pct_gdp is not None:
@@ -114,35 +291,9 @@ def _run_household_snapshot(
         )
     
     # Main display
-    print(
-        Panel(
-            f"[b]Regime:[/b] {regime.label}\n"
-            f"[b]As of:[/b] {state.asof}\n\n"
-            f"[dim]{regime.description}[/dim]\n"
-            f"{sectoral_text}\n"
-            f"[bold cyan]Wealth Metrics[/bold cyan]\n"
-            f"  Net Worth YoY:       {_fmt_pct(inp.net_worth_yoy_pct)}  (z={_fmt_z(inp.z_net_worth_yoy)})\n"
-            f"  Real Net Worth YoY:  {_fmt_pct(inp.net_worth_real_yoy_pct)}\n"
-            f"  Savings Rate:        {_fmt(inp.savings_rate, 1, '%')}  (z={_fmt_z(inp.z_savings_rate)})\n"
-            f"\n[bold cyan]Debt Metrics[/bold cyan]\n"
-            f"  Debt Service Ratio:  {_fmt(inp.debt_service_ratio, 1, '%')}  (z={_fmt_z(inp.z_debt_service)})\n"
-            f"  Consumer Credit YoY: {_fmt_pct(inp.consumer_credit_yoy_pct)}  (z={_fmt_z(inp.z_consumer_credit_yoy)})\n"
-            f"  Revolving Cred YoY:  {_fmt_pct(inp.revolving_credit_yoy_pct)}\n"
-            f"  Mortgage Delinq:     {_fmt(inp.mortgage_delinquency_rate, 2, '%')}\n"
-            f"\n[bold cyan]Behavioral Metrics[/bold cyan]\n"
-            f"  Consumer Sentiment:  {_fmt(inp.consumer_sentiment, 1)}  (z={_fmt_z(inp.z_consumer_sentiment)})\n"
-            f"  M2 Velocity:         {_fmt(inp.m2_velocity, 2)}  (z={_fmt_z(inp.z_m2_velocity)})\n"
-            f"  Real DPI YoY:        {_fmt_pct(inp.real_dpi_yoy_pct)}  (z={_fmt_z(inp.z_real_dpi_yoy)})\n"
-            f"  Retail Sales YoY:    {_fmt_pct(inp.retail_sales_yoy_pct)}  (z={_fmt_z(inp.z_retail_sales_yoy)})\n"
-            f"\n[bold cyan]Composite Scores[/bold cyan]\n"
-            f"  Wealth Score:        {_fmt_z(inp.wealth_score)}\n"
-            f"  Debt Stress Score:   {_fmt_z(inp.debt_stress_score)}\n"
-            f"  Behavioral Score:    {_fmt_z(inp.behavioral_score)}\n"
-            f"  [b]Prosperity Score:[/b]  {_fmt_z(inp.household_prosperity_score)}\n",
-            title="Household Wealth Regime",
-            expand=False,
-        )
-    )
+    fields = {name: fmt(getattr(inp, attr)) for name, attr, fmt in _SNAPSHOT_FIELDS}
+    fields.update(label=regime.label, asof=state.asof, description=regime.description, sectoral=sectoral_text)
+    print(Panel(_SNAPSHOT_TEMPLATE.format_map(fields), title="Household Wealth Regime", expand=False))
     
     # Market implications
     if regime.market_implications:
@@ -156,47 +307,39 @@ def _run_household_snapshot(
     
     # LLM analysis
     if llm:
-        from ai_options_trader.llm.core.analyst import llm_analyze_regime
+        llm_analyze_regime, Markdown = _llm_tools()
         
         print("\n[bold cyan]Generating LLM analysis...[/bold cyan]\n")
         
         snapshot_data = {
             "regime": regime.name,
             "regime_label": regime.label,
-            # Sectoral balances
-            "govt_deficit_pct_gdp": inp.sectoral.govt_deficit_pct_gdp if inp.sectoral else None,
-            "net_exports_pct_gdp": inp.sectoral.net_exports_pct_gdp if inp.sectoral else None,
-            "private_balance_pct_gdp": inp.sectoral.private_balance_pct_gdp if inp.sectoral else None,
-            # Wealth
-            "net_worth_yoy_pct": inp.net_worth_yoy_pct,
-            "net_worth_real_yoy_pct": inp.net_worth_real_yoy_pct,
-            "savings_rate": inp.savings_rate,
-            "z_savings_rate": inp.z_savings_rate,
-            # Debt
-            "debt_service_ratio": inp.debt_service_ratio,
-            "z_debt_service": inp.z_debt_service,
-            "consumer_credit_yoy_pct": inp.consumer_credit_yoy_pct,
-            # Behavior
-            "consumer_sentiment": inp.consumer_sentiment,
-            "z_consumer_sentiment": inp.z_consumer_sentiment,
-            "m2_velocity": inp.m2_velocity,
-            "z_m2_velocity": inp.z_m2_velocity,
-            # Composites
-            "wealth_score": inp.wealth_score,
-            "debt_stress_score": inp.debt_stress_score,
-            "behavioral_score": inp.behavioral_score,
-            "prosperity_score": inp.household_prosperity_score,
+            **_sectoral_triple(inp.sectoral),
+            **dict(zip(_LLM_SNAPSHOT_KEYS, _get_llm_snapshot(inp))),
         }
         
-        analysis = llm_analyze_regime(
-            settings=settings,
-            domain="household",
-            snapshot=snapshot_data,
-            regime_label=regime.label,
-            regime_description=regime.description,
-        )
+        t0 = time.perf_counter()
+        try:
+            analysis = llm_analyze_regime(
+                settings=load_settings(),
+                domain="household",
+                snapshot=snapshot_data,
+                regime_label=regime.label,
+                regime_description=regime.description,
+            )
+        except Exception as e:
+            # Keep the run useful: show the snapshot the LLM would have seen.
+            print(f"[yellow]LLM analysis failed:[/yellow] {type(e).__name__}: {e}")
+            print(Panel(
+                "\n".join(f"{k}: {v}" for k, v in snapshot_data.items()),
+                title="LLM Snapshot (raw)",
+                expand=False,
+            ))
+            return
+        finally:
+            if verbose:
+                print(f"[dim]LLM call: {time.perf_counter() - t0:.2f}s[/dim]")
         
-        from rich.markdown import Markdown
         print(Panel(Markdown(analysis), title="LLM Analysis", expand=False))
 
 
@@ -209,6 +352,7 @@ def register(household_app: typer.Typer) -> None:
         llm: bool = typer.Option(False, "--llm", help="Get LLM analysis of household regime"),
         features: bool = typer.Option(False, "--features", help="Output ML feature vector"),
         json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+        verbose: bool = typer.Option(False, "--verbose", "-v", help="Show LLM call timing"),
     ):
         """
         Household wealth regime: where do deficit dollars flow?
@@ -223,7 +367,7 @@ def register(household_app: typer.Typer) -> None:
         - CORPORATE_CAPTURE: Deficit not reaching households
         """
         if ctx.invoked_subcommand is None:
-            _run_household_snapshot(llm=llm, features=features, json_output=json_output)
+            _run_household_snapshot(llm=llm, features=features, json_output=json_output, verbose=verbose)
     
     @household_app.command("snapshot")
     def snapshot(
@@ -232,6 +376,7 @@ def register(household_app: typer.Typer) -> None:
         llm: bool = typer.Option(False, "--llm", help="Get LLM analysis of household regime"),
         features: bool = typer.Option(False, "--features", help="Output ML feature vector"),
         json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+        verbose: bool = typer.Option(False, "--verbose", "-v", help="Show LLM call timing"),
     ):
         """
         Household wealth regime snapshot.
@@ -245,6 +390,7 @@ def register(household_app: typer.Typer) -> None:
             llm=llm,
             features=features,
             json_output=json_output,
+            verbose=verbose,
         )
     
     @household_app.command("sectoral")
@@ -258,30 +404,21 @@ def register(household_app: typer.Typer) -> None:
         Government deficits create private surpluses by accounting identity.
         This shows where the money flows.
         """
-        from ai_options_trader.config import load_settings
-        from ai_options_trader.household.signals import build_sectoral_balances
+        from rich import print
+        from rich.panel import Panel
         
-        settings = load_settings()
-        sb = build_sectoral_balances(settings=settings, start_date=start, refresh=refresh)
+        sb = _sectoral(start, refresh)
         
+        fields = {
+            "asof": sb.asof or "N/A",
+            "g": _fmt_pct(sb.govt_deficit_pct_gdp),
+            "nx": _fmt_pct(sb.net_exports_pct_gdp),
+            "i": _fmt_pct(sb.private_investment_pct_gdp),
+            "s": _fmt_pct(sb.private_balance_pct_gdp),
+        }
         print(
             Panel(
-                f"[b]MMT Sectoral Balances Identity[/b]\n"
-                f"S = (G - T) + I + NX\n\n"
-                f"Where:\n"
-                f"  S   = Private Sector Savings\n"
-                f"  G-T = Government Deficit\n"
-                f"  I   = Net Investment\n"
-                f"  NX  = Net Exports\n\n"
-                f"[b]As of:[/b] {sb.asof or 'N/A'}\n\n"
-                f"[bold cyan]Current Values (% of GDP)[/bold cyan]\n"
-                f"  Government Deficit (G-T): {_fmt_pct(sb.govt_deficit_pct_gdp)}\n"
-                f"  Net Exports (NX):         {_fmt_pct(sb.net_exports_pct_gdp)}\n"
-                f"  Private Investment (I):   {_fmt_pct(sb.private_investment_pct_gdp)}\n"
-                f"  [b]Private Balance (S):[/b]     {_fmt_pct(sb.private_balance_pct_gdp)}\n\n"
-                f"[dim]Key insight: Government deficits necessarily create private surpluses.[/dim]\n"
-                f"[dim]The question is WHERE they accumulate (households vs corporations)[/dim]\n"
-                f"[dim]and what BEHAVIOR they drive (saving, spending, or deleveraging).[/dim]",
+                _SECTORAL_TEMPLATE.format_map(fields),
                 title="Sectoral Balances (MMT Framework)",
                 expand=False,
             )
@@ -297,12 +434,20 @@ def register(household_app: typer.Typer) -> None:
         
         Shows debt service burden, credit dynamics, and stress indicators.
         """
-        from ai_options_trader.config import load_settings
-        from ai_options_trader.household.signals import build_household_state
+        from rich import print
+        from rich.panel import Panel
+        from rich.table import Table
         
-        settings = load_settings()
-        state = build_household_state(settings=settings, start_date=start, refresh=refresh)
-        inp = state.inputs
+        inp = _household_state(start, refresh).inputs
+        (dsr, z_dsr, cc_yoy, z_cc, rev_yoy, mdq, z_mdq, dstress) = (
+            inp.debt_service_ratio, inp.z_debt_service,
+            inp.consumer_credit_yoy_pct, inp.z_consumer_credit_yoy,
+            inp.revolving_credit_yoy_pct,
+            inp.mortgage_delinquency_rate, inp.z_mortgage_delinquency,
+            inp.debt_stress_score,
+        )
+        # Z-scores are formatted once and shared by the table and the composite panel.
+        fz_dsr, fz_cc, fz_mdq = _fmt_z(z_dsr), _fmt_z(z_cc), _fmt_z(z_mdq)
         
         tbl = Table(title="Household Debt Metrics")
         tbl.add_column("Metric", style="cyan")
@@ -310,61 +455,29 @@ def register(household_app: typer.Typer) -> None:
         tbl.add_column("Z-Score", justify="right")
         tbl.add_column("Interpretation")
         
-        # Debt service
-        dsr = inp.debt_service_ratio
-        z_dsr = inp.z_debt_service
-        dsr_interp = "Normal"
-        if z_dsr is not None:
-            if z_dsr >= 1.0:
-                dsr_interp = "Elevated burden"
-            elif z_dsr <= -1.0:
-                dsr_interp = "Low burden"
         tbl.add_row(
             "Debt Service Ratio",
-            _fmt(dsr, 1, "%"),
-            _fmt_z(z_dsr),
-            dsr_interp,
+            _fmt1pct(dsr),
+            fz_dsr,
+            _interp(z_dsr, hi=(1.0, "Elevated burden"), lo=(-1.0, "Low burden")),
         )
-        
-        # Consumer credit
-        cc_yoy = inp.consumer_credit_yoy_pct
-        z_cc = inp.z_consumer_credit_yoy
-        cc_interp = "Normal"
-        if z_cc is not None:
-            if z_cc >= 1.5:
-                cc_interp = "Rapid expansion"
-            elif z_cc <= -1.0:
-                cc_interp = "Contraction"
         tbl.add_row(
             "Consumer Credit YoY",
             _fmt_pct(cc_yoy),
-            _fmt_z(z_cc),
-            cc_interp,
+            fz_cc,
+            _interp(z_cc, hi=(1.5, "Rapid expansion"), lo=(-1.0, "Contraction")),
         )
-        
-        # Revolving credit
-        rev_yoy = inp.revolving_credit_yoy_pct
         tbl.add_row(
             "Revolving (Cards) YoY",
             _fmt_pct(rev_yoy),
-            "—",
+            _DASH,
             "Credit card growth",
         )
-        
-        # Mortgage delinquency
-        mdq = inp.mortgage_delinquency_rate
-        z_mdq = inp.z_mortgage_delinquency
-        mdq_interp = "Normal"
-        if z_mdq is not None:
-            if z_mdq >= 1.0:
-                mdq_interp = "Elevated stress"
-            elif z_mdq <= -1.0:
-                mdq_interp = "Low stress"
         tbl.add_row(
             "Mortgage Delinquency",
-            _fmt(mdq, 2, "%"),
-            _fmt_z(z_mdq),
-            mdq_interp,
+            _fmt2pct(mdq),
+            fz_mdq,
+            _interp(z_mdq, hi=(1.0, "Elevated stress"), lo=(-1.0, "Low stress")),
         )
         
         print(tbl)
@@ -372,11 +485,11 @@ def register(household_app: typer.Typer) -> None:
         # Debt stress composite
         print(
             Panel(
-                f"[b]Debt Stress Score:[/b] {_fmt_z(inp.debt_stress_score)}\n\n"
+                f"[b]Debt Stress Score:[/b] {_fmt_z(dstress)}\n\n"
                 f"Components:\n"
-                f"  Z(Debt Service):     {_fmt_z(inp.z_debt_service)} × 40%\n"
-                f"  Z(Credit Growth):    {_fmt_z(inp.z_consumer_credit_yoy)} × 30%\n"
-                f"  Z(Delinquency):      {_fmt_z(inp.z_mortgage_delinquency)} × 30%\n\n"
+                f"  Z(Debt Service):     {fz_dsr} × 40%\n"
+                f"  Z(Credit Growth):    {fz_cc} × 30%\n"
+                f"  Z(Delinquency):      {fz_mdq} × 30%\n\n"
                 f"[dim]Positive = more debt stress, negative = healthy debt dynamics[/dim]",
                 title="Debt Stress Composite",
                 expand=False,
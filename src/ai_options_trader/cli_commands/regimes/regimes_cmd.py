@@ -1,15 +1,186 @@
 from __future__ import annotations
 
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+
+import numpy as np
 import pandas as pd
 import typer
 from rich import print
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
+from ai_options_trader.cli_commands.shared.json_out import write_json_stdout
+from ai_options_trader.commodities.features import commodities_feature_vector
 from ai_options_trader.config import load_settings
-from ai_options_trader.macro.regime import classify_macro_regime_from_state
-from ai_options_trader.macro.signals import build_macro_state
+from ai_options_trader.data.fred import FredClient
+from ai_options_trader.data.price_cache import cached_equity_daily_closes
+from ai_options_trader.funding.features import funding_feature_vector
+from ai_options_trader.macro.features import macro_feature_vector
+from ai_options_trader.rates.features import rates_feature_vector
+from ai_options_trader.regimes.bundle import build_bundle
+from ai_options_trader.regimes.schema import merge_feature_dicts
+from ai_options_trader.regimes.state_cache import cached_state
+from ai_options_trader.tariff.features import tariff_feature_vector
+from ai_options_trader.tariff.proxies import DEFAULT_COST_PROXY_SERIES
+from ai_options_trader.tariff.signals import build_tariff_regime_state
+from ai_options_trader.tariff.universe import ALL_BASKET_NAMES, ALL_UNIVERSE, BASKETS
+from ai_options_trader.usd.features import usd_feature_vector
+from ai_options_trader.volatility.features import volatility_feature_vector
+
+
+def _fetch_cost_proxies(fred, *, start: str, refresh: bool) -> pd.DataFrame:
+    """
+    Fetch the tariff cost-proxy FRED series concurrently (I/O bound) and align them daily.
+
+    Columns follow `DEFAULT_COST_PROXY_SERIES` order.
+    """
+    def _fetch(col_sid: tuple[str, str]) -> pd.DataFrame:
+        col, sid = col_sid
+        df = fred.fetch_series(sid, start_date=start, refresh=refresh)
+        return df.rename(columns={"value": col}).set_index("date")[[col]]
+
+    with ThreadPoolExecutor(max_workers=min(8, len(DEFAULT_COST_PROXY_SERIES))) as ex:
+        frames = list(ex.map(_fetch, DEFAULT_COST_PROXY_SERIES.items()))
+    # Union the date indexes once and assign each series into a pre-allocated frame; this skips
+    # concat's intermediate sorted outer join. A plain daily reindex + ffill then avoids
+    # resample's groupby machinery.
+    union_idx = reduce(lambda a, b: a.union(b), (f.index for f in frames))
+    cost_df = pd.DataFrame(index=union_idx)
+    for f in frames:
+        col = f.columns[0]
+        cost_df[col] = f[col].reindex(union_idx)
+    if cost_df.empty:
+        return cost_df
+    idx = pd.date_range(cost_df.index.min(), cost_df.index.max(), freq="D")
+    return cost_df.reindex(idx).ffill()
+
+
+def _cached_cost_proxies(fred, *, settings, start: str, refresh: bool) -> pd.DataFrame:
+    """
+    `_fetch_cost_proxies` through the regime-state cache, so back-to-back `regimes` /
+    `regime-features` runs reuse the aligned frame instead of re-reading and re-aligning
+    every FRED series.
+    """
+    def _build(*, settings, start_date: str, refresh: bool) -> pd.DataFrame:
+        return _fetch_cost_proxies(fred, start=start_date, refresh=refresh)
+
+    return cached_state("tariff_cost_proxies", _build, settings=settings, start_date=start, refresh=refresh)
+
+
+def _select_baskets(baskets: str) -> tuple[tuple[str, ...], tuple[str, ...] | set[str]]:
+    """Resolve the `--baskets` option into (basket names, ticker universe)."""
+    if baskets.strip().lower() == "all":
+        # Every name is known by construction: skip validation and reuse the precomputed union.
+        return ALL_BASKET_NAMES, ALL_UNIVERSE
+    basket_names = tuple(b.strip() for b in baskets.split(",") if b.strip())
+    unknown = [b for b in basket_names if b not in BASKETS]
+    if unknown:
+        raise typer.BadParameter(f"Unknown basket(s): {unknown}. Choose from: {list(ALL_BASKET_NAMES)}")
+    return basket_names, {sym for b in basket_names for sym in BASKETS[b].tickers}
+
+
+_FEATURE_FORMATS = ("json", "npz", "parquet")
+
+
+def _write_feature_array(asof, features: dict[str, float], *, fmt: str) -> None:
+    """
+    Write a feature vector to stdout as a fixed-schema binary payload.
+
+    - npz: `asof` (1,), `names` (n,) and `features` (n,) float32 arrays
+    - parquet: a single row with an `asof` column followed by one float32 column per feature
+
+    Features are z-scores / percentiles / flags, well within float32 precision, so the
+    binary payloads store them at half width.
+    """
+    names = np.array(list(features.keys()))
+    values = np.fromiter(features.values(), dtype=np.float32, count=len(features))
+    sys.stdout.flush()
+    if fmt == "npz":
+        np.savez(sys.stdout.buffer, asof=np.array([str(asof)]), names=names, features=values)
+    else:
+        df = pd.DataFrame(values[None, :], columns=names)
+        df.insert(0, "asof", str(asof))
+        try:
+            df.to_parquet(sys.stdout.buffer, index=False)
+        except ImportError as e:
+            raise typer.BadParameter(f"--format parquet needs a parquet engine (pyarrow): {e}") from e
+    sys.stdout.buffer.flush()
+
+
+def _build_tariff_states(baskets: list, *, cost_df: pd.DataFrame, px: pd.DataFrame, benchmark: str, start: str) -> list:
+    """
+    Build one tariff regime state per basket, in basket order.
+
+    Baskets only read the shared `cost_df` / `px` frames, so they run on a thread pool
+    (pandas/numpy kernels release the GIL; threads avoid pickling the price panel per task).
+    """
+    def _build_one(basket):
+        return build_tariff_regime_state(
+            cost_df=cost_df,
+            equity_prices=px,
+            universe=basket.tickers,
+            benchmark=benchmark,
+            basket_name=basket.name,
+            start_date=start,
+        )
+
+    if len(baskets) <= 1:
+        return [_build_one(b) for b in baskets]
+    with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 4, len(baskets))) as ex:
+        return list(ex.map(_build_one, baskets))
+
+
+# Unified-regime table layout: Monte Carlo core pillars, then extended context domains.
+_CORE_DOMAINS = ("macro", "volatility", "rates", "funding")
+_EXT_DOMAINS = ("fiscal", "commodities", "housing", "monetary", "usd", "crypto")
+_DESC_MAX = 60
+
+# Blank-line renderable for output batched into a single `console.print(Group(...))`.
+_BLANK = Text("")
+
+
+def _score_colors(scores: np.ndarray) -> np.ndarray:
+    """Risk-score color bands: <40 green, >60 red, otherwise yellow."""
+    return np.select([scores < 40, scores > 60], ["green", "red"], default="yellow")
+
+
+# (multiplicative?, sign vs. neutral) -> Rich markup template for Monte Carlo adjustments.
+_ADJ_TEMPLATES = {
+    (False, 1): "[red]+{:.1f}%[/red]",
+    (False, -1): "[green]{:.1f}%[/green]",
+    (True, 1): "[red]+{:.0f}%[/red]",
+    (True, -1): "[green]{:.0f}%[/green]",
+}
+
+
+def _fmt(val: float, base: float = 0.0, mult: bool = False) -> str:
+    """Format a Monte Carlo adjustment (additive vs `base`, or a multiplier vs 1.0) as colored %."""
+    ref = 1.0 if mult else base
+    sign = (val > ref) - (val < ref)
+    if not sign:
+        return "0%"
+    return _ADJ_TEMPLATES[(mult, sign)].format(((val - 1.0) if mult else val) * 100)
+
+
+def _regime_rows(state, domains: tuple[str, ...]) -> list[tuple[str, str, str, str]]:
+    """(Domain, Regime, colored Score, Description) cells for each unified-state domain."""
+    regimes = [getattr(state, d, None) for d in domains]
+    scores = np.fromiter((r.score if r else np.nan for r in regimes), dtype=float, count=len(regimes))
+    rows = []
+    for domain, regime, color in zip(domains, regimes, _score_colors(scores)):
+        if not regime:
+            rows.append((domain.title(), "N/A", "-", "Data unavailable"))
+            continue
+        desc = regime.description
+        if len(desc) > _DESC_MAX:
+            desc = desc[: _DESC_MAX - 3] + "..."
+        rows.append((domain.title(), regime.label, f"[{color}]{regime.score:.0f}[/{color}]", desc))
+    return rows
 
 
 def register(app: typer.Typer) -> None:
@@ -27,26 +198,23 @@ def register(app: typer.Typer) -> None:
         and extracting ML-friendly features.
         """
         from ai_options_trader.regimes import build_unified_regime_state
-        import json as json_module
         
         console = Console()
         settings = load_settings()
         
         with console.status("[cyan]Building unified regime state...[/cyan]"):
-            state = build_unified_regime_state(
-                settings=settings,
-                start_date=start,
-                refresh=refresh,
+            state = cached_state(
+                "unified", build_unified_regime_state, settings=settings, start_date=start, refresh=refresh,
             )
         
         if json_output:
-            features = state.to_feature_dict()
-            print(json_module.dumps(features, indent=2, default=str))
+            write_json_stdout(state.to_feature_dict(), default=str)
             return
         
-        # Display as rich table
-        console.print()
-        console.print(Panel(
+        # Display as rich tables, laid out and written in a single console.print
+        out: list = []
+        out.append(_BLANK)
+        out.append(Panel(
             f"[bold]Overall: {state.overall_category.upper()}[/bold] (score: {state.overall_risk_score:.0f}/100)",
             title=f"🎯 Unified Regime State — {state.asof}",
             border_style="cyan",
@@ -59,21 +227,11 @@ def register(app: typer.Typer) -> None:
         core_table.add_column("Score", justify="right")
         core_table.add_column("Description")
         
-        for domain in ["macro", "volatility", "rates", "funding"]:
-            regime = getattr(state, domain, None)
-            if regime:
-                score_color = "green" if regime.score < 40 else ("red" if regime.score > 60 else "yellow")
-                core_table.add_row(
-                    domain.title(),
-                    regime.label,
-                    f"[{score_color}]{regime.score:.0f}[/{score_color}]",
-                    regime.description[:60] + "..." if len(regime.description) > 60 else regime.description,
-                )
-            else:
-                core_table.add_row(domain.title(), "N/A", "-", "Data unavailable")
+        for row in _regime_rows(state, _CORE_DOMAINS):
+            core_table.add_row(*row)
         
-        console.print(core_table)
-        console.print()
+        out.append(core_table)
+        out.append(_BLANK)
         
         # Extended regimes table
         ext_table = Table(title="Extended Regimes (Context)", show_header=True, header_style="bold magenta")
@@ -82,21 +240,11 @@ def register(app: typer.Typer) -> None:
         ext_table.add_column("Score", justify="right")
         ext_table.add_column("Description")
         
-        for domain in ["fiscal", "commodities", "housing", "monetary", "usd", "crypto"]:
-            regime = getattr(state, domain, None)
-            if regime:
-                score_color = "green" if regime.score < 40 else ("red" if regime.score > 60 else "yellow")
-                ext_table.add_row(
-                    domain.title(),
-                    regime.label,
-                    f"[{score_color}]{regime.score:.0f}[/{score_color}]",
-                    regime.description[:60] + "..." if len(regime.description) > 60 else regime.description,
-                )
-            else:
-                ext_table.add_row(domain.title(), "N/A", "-", "Data unavailable")
+        for row in _regime_rows(state, _EXT_DOMAINS):
+            ext_table.add_row(*row)
         
-        console.print(ext_table)
-        console.print()
+        out.append(ext_table)
+        out.append(_BLANK)
         
         # Monte Carlo parameters
         mc_params = state.to_monte_carlo_params()
@@ -105,32 +253,17 @@ def register(app: typer.Typer) -> None:
         mc_table.add_column("Value", justify="right")
         mc_table.add_column("Effect")
         
-        def fmt_adj(val, base=0.0, mult=False):
-            if mult:
-                if val > 1.0:
-                    return f"[red]+{(val-1)*100:.0f}%[/red]"
-                elif val < 1.0:
-                    return f"[green]{(val-1)*100:.0f}%[/green]"
-                else:
-                    return "0%"
-            else:
-                if val > base:
-                    return f"[red]+{val*100:.1f}%[/red]"
-                elif val < base:
-                    return f"[green]{val*100:.1f}%[/green]"
-                else:
-                    return "0%"
+        mc_table.add_row("Equity Drift Adj", _fmt(mc_params["equity_drift_adj"]), "Annual return modifier")
+        mc_table.add_row("Equity Vol Adj", _fmt(mc_params["equity_vol_adj"], mult=True), "Volatility multiplier")
+        mc_table.add_row("IV Drift Adj", _fmt(mc_params["iv_drift_adj"]), "Implied vol shift")
+        mc_table.add_row("Jump Prob Adj", _fmt(mc_params["jump_prob_adj"], mult=True), "Tail event likelihood")
+        mc_table.add_row("Spread Drift Adj", _fmt(mc_params["spread_drift_adj"]), "Credit spread shift")
         
-        mc_table.add_row("Equity Drift Adj", fmt_adj(mc_params["equity_drift_adj"]), "Annual return modifier")
-        mc_table.add_row("Equity Vol Adj", fmt_adj(mc_params["equity_vol_adj"], mult=True), "Volatility multiplier")
-        mc_table.add_row("IV Drift Adj", fmt_adj(mc_params["iv_drift_adj"]), "Implied vol shift")
-        mc_table.add_row("Jump Prob Adj", fmt_adj(mc_params["jump_prob_adj"], mult=True), "Tail event likelihood")
-        mc_table.add_row("Spread Drift Adj", fmt_adj(mc_params["spread_drift_adj"]), "Credit spread shift")
+        out.append(mc_table)
+        out.append(_BLANK)
         
-        console.print(mc_table)
-        console.print()
-        
-        console.print("[dim]Run with --json for ML-friendly feature export[/dim]")
+        out.append("[dim]Run with --json for ML-friendly feature export[/dim]")
+        console.print(Group(*out))
     
     @app.command("transitions")
     def regime_transitions(
@@ -163,7 +296,10 @@ def register(app: typer.Typer) -> None:
         if adjust:
             with console.status("[cyan]Loading regime data for signal analysis...[/cyan]"):
                 try:
-                    unified_state = build_unified_regime_state(settings=settings, refresh=refresh)
+                    unified_state = cached_state(
+                        "unified", build_unified_regime_state,
+                        settings=settings, start_date="2020-01-01", refresh=refresh,
+                    )
                     matrix, signals = get_adjusted_transition_matrix(domain, horizon, unified_state)
                 except Exception as e:
                     console.print(f"[yellow]Warning: Could not load signals ({e}), using base matrix[/yellow]")
@@ -171,9 +307,10 @@ def register(app: typer.Typer) -> None:
         else:
             matrix = get_transition_matrix(domain, horizon_days=horizon)
         
+        out: list = []
         # Header with clear explanation
-        console.print()
-        console.print(Panel(
+        out.append(_BLANK)
+        out.append(Panel(
             "[bold]What is this?[/bold]\n"
             "Probability of the market regime changing over the forecast horizon.\n"
             "Used to weight Monte Carlo scenarios by how likely each regime is.\n\n"
@@ -187,10 +324,10 @@ def register(app: typer.Typer) -> None:
         ))
         
         # Transition matrix with clear labels
-        console.print()
-        console.print("[bold]Transition Probabilities[/bold]")
-        console.print("[dim]Read as: If TODAY is (row), what's the probability NEXT PERIOD is (column)?[/dim]")
-        console.print()
+        out.append(_BLANK)
+        out.append("[bold]Transition Probabilities[/bold]")
+        out.append("[dim]Read as: If TODAY is (row), what's the probability NEXT PERIOD is (column)?[/dim]")
+        out.append(_BLANK)
         
         table = Table(show_header=True, header_style="bold cyan")
         table.add_column("If TODAY is...", style="bold")
@@ -210,13 +347,13 @@ def register(app: typer.Typer) -> None:
                     row.append(f"[dim]{prob:.0%}[/dim]")
             table.add_row(*row)
         
-        console.print(table)
-        console.print()
+        out.append(table)
+        out.append(_BLANK)
         
         # Forecast from current state
-        console.print(f"[bold]Your Forecast (starting from '{current}'):[/bold]")
-        console.print(f"[dim]In {horizon} trading days (~{horizon//21} month{'s' if horizon > 21 else ''}), the market will likely be:[/dim]")
-        console.print()
+        out.append(f"[bold]Your Forecast (starting from '{current}'):[/bold]")
+        out.append(f"[dim]In {horizon} trading days (~{horizon//21} month{'s' if horizon > 21 else ''}), the market will likely be:[/dim]")
+        out.append(_BLANK)
         
         probs = matrix.get_next_state_probs(current)
         for state, prob in sorted(probs.items(), key=lambda x: -x[1]):
@@ -233,26 +370,27 @@ def register(app: typer.Typer) -> None:
             else:
                 interp = ""
             
-            console.print(f"  {state.replace('_', ' ').title():12} {bar} [bold]{prob:.0%}[/bold] {interp}")
+            out.append(f"  {state.replace('_', ' ').title():12} {bar} [bold]{prob:.0%}[/bold] {interp}")
         
         # Show active leading indicators if adjusting
         active_signals = signals.active_signals()
         if adjust and active_signals:
-            console.print()
-            console.print("[bold yellow]⚠ Active Warning Signals (adjusting probabilities):[/bold yellow]")
+            out.append(_BLANK)
+            out.append("[bold yellow]⚠ Active Warning Signals (adjusting probabilities):[/bold yellow]")
             risk_off_mult, risk_on_mult = signals.risk_adjustment_factor()
             for sig in active_signals:
                 indicator = LEADING_INDICATORS.get(sig, {})
-                console.print(f"  • [yellow]{sig.replace('_', ' ').title()}[/yellow]: {indicator.get('description', '')}")
-            console.print()
-            console.print(f"  [dim]Combined adjustment: risk_off ×{risk_off_mult:.1f}, risk_on ×{risk_on_mult:.1f}[/dim]")
+                out.append(f"  • [yellow]{sig.replace('_', ' ').title()}[/yellow]: {indicator.get('description', '')}")
+            out.append(_BLANK)
+            out.append(f"  [dim]Combined adjustment: risk_off ×{risk_off_mult:.1f}, risk_on ×{risk_on_mult:.1f}[/dim]")
         elif adjust:
-            console.print()
-            console.print("[green]✓ No warning signals active - using base historical probabilities[/green]")
+            out.append(_BLANK)
+            out.append("[green]✓ No warning signals active - using base historical probabilities[/green]")
         
-        console.print()
-        console.print("[dim]Usage: These probabilities weight Monte Carlo scenarios.[/dim]")
-        console.print("[dim]       Use --no-adjust to see raw historical frequencies.[/dim]")
+        out.append(_BLANK)
+        out.append("[dim]Usage: These probabilities weight Monte Carlo scenarios.[/dim]")
+        out.append("[dim]       Use --no-adjust to see raw historical frequencies.[/dim]")
+        console.print(Group(*out))
     @app.command("regimes")
     def regimes(
         start: str = typer.Option("2011-01-01", "--start", help="Start date YYYY-MM-DD"),
@@ -270,79 +408,41 @@ def register(app: typer.Typer) -> None:
         """
         Print the current macro regime and all tariff/cost-push regimes (by basket).
         """
-        from ai_options_trader.data.fred import FredClient
-        from ai_options_trader.data.market import fetch_equity_daily_closes
-        from ai_options_trader.funding.signals import build_funding_state
-        from ai_options_trader.tariff.universe import BASKETS
-        from ai_options_trader.tariff.proxies import DEFAULT_COST_PROXY_SERIES
-        from ai_options_trader.tariff.signals import build_tariff_regime_state
-
         settings = load_settings()
+        states = build_bundle(settings, start_date=start, refresh=refresh, domains=("macro", "funding"))
 
         # --- Macro ---
-        macro_state = build_macro_state(settings=settings, start_date=start, refresh=refresh)
+        macro_state = states.macro
         print(macro_state)
-        macro_regime = classify_macro_regime_from_state(
-            cpi_yoy=macro_state.inputs.cpi_yoy,
-            payrolls_3m_annualized=macro_state.inputs.payrolls_3m_annualized,
-            inflation_momentum_minus_be5y=macro_state.inputs.inflation_momentum_minus_be5y,
-            real_yield_proxy_10y=macro_state.inputs.real_yield_proxy_10y,
-            z_inflation_momentum_minus_be5y=macro_state.inputs.components.get("z_infl_mom_minus_be5y") if macro_state.inputs.components else None,
-            z_real_yield_proxy_10y=macro_state.inputs.components.get("z_real_yield_proxy_10y") if macro_state.inputs.components else None,
-            use_zscores=True,
-            cpi_target=3.0,
-            infl_thresh=0.0,
-            real_thresh=0.0,
-        )
+        macro_regime = states.macro_regime
         print("\nMACRO REGIME")
         print(macro_regime)
 
         # --- Liquidity ---
-        liquidity_state = build_funding_state(settings=settings, start_date=start, refresh=refresh)
+        liquidity_state = states.funding
         print("\nLIQUIDITY (CREDIT + RATES)")
         print(liquidity_state)
 
         # --- Tariff baskets selection ---
-        if baskets.strip().lower() == "all":
-            basket_names = list(BASKETS.keys())
-        else:
-            basket_names = [b.strip() for b in baskets.split(",") if b.strip()]
-
-        unknown = [b for b in basket_names if b not in BASKETS]
-        if unknown:
-            raise typer.BadParameter(f"Unknown basket(s): {unknown}. Choose from: {list(BASKETS.keys())}")
+        basket_names, universe = _select_baskets(baskets)
 
         # --- Cost proxies (FRED) fetched once ---
         if not settings.FRED_API_KEY:
             raise RuntimeError("Missing FRED_API_KEY in environment / .env")
         fred = FredClient(api_key=settings.FRED_API_KEY)
-
-        frames = []
-        for col, sid in DEFAULT_COST_PROXY_SERIES.items():
-            df = fred.fetch_series(sid, start_date=start, refresh=refresh)
-            df = df.rename(columns={"value": col}).set_index("date")
-            frames.append(df[[col]])
-        cost_df = pd.concat(frames, axis=1).sort_index().resample("D").ffill()
+        cost_df = _cached_cost_proxies(fred, settings=settings, start=start, refresh=refresh)
 
         # --- Equities (historical closes; default: FMP) fetched once ---
-        all_universe = sorted({sym for b in basket_names for sym in BASKETS[b].tickers})
-        symbols = sorted(set(all_universe + [benchmark.strip().upper()]))
-        px = fetch_equity_daily_closes(settings=settings, symbols=symbols, start=start, refresh=bool(refresh))
+        symbols = sorted(set(universe).union({benchmark.strip().upper()}))
+        px = cached_equity_daily_closes(settings=settings, symbols=symbols, start=start, refresh=refresh)
         px = px.sort_index().ffill().dropna(how="all")
 
         print("\nTARIFF / COST-PUSH REGIMES")
+        basket_list = [BASKETS[b] for b in basket_names]
+        tariff_states = _build_tariff_states(basket_list, cost_df=cost_df, px=px, benchmark=benchmark, start=start)
         tariff_results = []
-        for b in basket_names:
-            basket = BASKETS[b]
+        for basket, state in zip(basket_list, tariff_states):
             print(f"\n[b]{basket.name}[/b] — {basket.description}")
-            state = build_tariff_regime_state(
-                cost_df=cost_df,
-                equity_prices=px,
-                universe=basket.tickers,
-                benchmark=benchmark,
-                basket_name=basket.name,
-                start_date=start,
-            )
             print(state)
             tariff_results.append(
                 {
@@ -378,6 +478,11 @@ def register(app: typer.Typer) -> None:
             help="Comma-separated basket names, or 'all' (see: ai-options-trader tariff baskets)",
         ),
         pretty: bool = typer.Option(True, "--pretty/--compact", help="Pretty-print JSON"),
+        output_format: str = typer.Option(
+            "json",
+            "--format",
+            help="Output format: json | npz (asof/names/features arrays) | parquet (one row; needs pyarrow)",
+        ),
     ):
         """
         Print a single merged, ML-friendly feature vector (floats only) for:
@@ -385,109 +490,64 @@ def register(app: typer.Typer) -> None:
         - liquidity regime (credit + rates)
         - tariff/cost-push regimes (per basket + aggregates)
         """
-        import json
-
-        from ai_options_trader.data.fred import FredClient
-        from ai_options_trader.data.market import fetch_equity_daily_closes
-        from ai_options_trader.funding.features import funding_feature_vector
-        from ai_options_trader.funding.signals import build_funding_state
-        from ai_options_trader.macro.features import macro_feature_vector
-        from ai_options_trader.rates.features import rates_feature_vector
-        from ai_options_trader.rates.regime import classify_rates_regime
-        from ai_options_trader.rates.signals import build_rates_state
-        from ai_options_trader.regimes.schema import merge_feature_dicts
-        from ai_options_trader.tariff.features import tariff_feature_vector
-        from ai_options_trader.tariff.proxies import DEFAULT_COST_PROXY_SERIES
-        from ai_options_trader.tariff.signals import build_tariff_regime_state
-        from ai_options_trader.tariff.universe import BASKETS
-        from ai_options_trader.usd.features import usd_feature_vector
-        from ai_options_trader.usd.signals import build_usd_state
-        from ai_options_trader.volatility.features import volatility_feature_vector
-        from ai_options_trader.volatility.regime import classify_volatility_regime
-        from ai_options_trader.volatility.signals import build_volatility_state
-        from ai_options_trader.commodities.features import commodities_feature_vector
-        from ai_options_trader.commodities.regime import classify_commodities_regime
-        from ai_options_trader.commodities.signals import build_commodities_state
-
+        fmt = output_format.strip().lower()
+        if fmt not in _FEATURE_FORMATS:
+            raise typer.BadParameter(f"Unknown --format {output_format!r}. Choose from: {list(_FEATURE_FORMATS)}")
         settings = load_settings()
 
+        # Tariff basket selection
+        basket_names, universe = _select_baskets(baskets)
+
+        # Cost proxies (FRED) + equities (historical closes; default: FMP) fetched once
+        if not settings.FRED_API_KEY:
+            raise RuntimeError("Missing FRED_API_KEY in environment / .env")
+        fred = FredClient(api_key=settings.FRED_API_KEY)
+        symbols = sorted(set(universe).union({benchmark.strip().upper()}))
+
+        # The regime builders and the tariff inputs are independent, network-bound pulls:
+        # run them concurrently so the wall time is the slowest pull, not the sum.
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            fut_states = ex.submit(build_bundle, settings, start_date=start, refresh=refresh)
+            fut_cost = ex.submit(_cached_cost_proxies, fred, settings=settings, start=start, refresh=refresh)
+            fut_px = ex.submit(cached_equity_daily_closes, settings=settings, symbols=symbols, start=start, refresh=refresh)
+            states = fut_states.result()
+            cost_df = fut_cost.result()
+            px = fut_px.result()
+
+        macro_state = states.macro
+        liq_state = states.funding
+        usd_state = states.usd
+        rates_state = states.rates
+        vol_state = states.volatility
+        commod_state = states.commodities
+
         # Macro
-        macro_state = build_macro_state(settings=settings, start_date=start, refresh=refresh)
-        macro_regime = classify_macro_regime_from_state(
-            cpi_yoy=macro_state.inputs.cpi_yoy,
-            payrolls_3m_annualized=macro_state.inputs.payrolls_3m_annualized,
-            inflation_momentum_minus_be5y=macro_state.inputs.inflation_momentum_minus_be5y,
-            real_yield_proxy_10y=macro_state.inputs.real_yield_proxy_10y,
-            z_inflation_momentum_minus_be5y=macro_state.inputs.components.get("z_infl_mom_minus_be5y") if macro_state.inputs.components else None,
-            z_real_yield_proxy_10y=macro_state.inputs.components.get("z_real_yield_proxy_10y") if macro_state.inputs.components else None,
-            use_zscores=True,
-            cpi_target=3.0,
-            infl_thresh=0.0,
-            real_thresh=0.0,
-        )
+        macro_regime = states.macro_regime
         macro_vec = macro_feature_vector(macro_state=macro_state, macro_regime=macro_regime)
 
         # Liquidity
-        liq_state = build_funding_state(settings=settings, start_date=start, refresh=refresh)
         liq_vec = funding_feature_vector(liq_state)
 
         # USD
-        usd_state = build_usd_state(settings=settings, start_date=start, refresh=refresh)
         usd_vec = usd_feature_vector(usd_state)
 
         # Rates
-        rates_state = build_rates_state(settings=settings, start_date=start, refresh=refresh)
-        rates_regime = classify_rates_regime(rates_state.inputs)
+        rates_regime = states.rates_regime
         rates_vec = rates_feature_vector(rates_state, rates_regime)
 
         # Volatility
-        vol_state = build_volatility_state(settings=settings, start_date=start, refresh=refresh)
-        vol_regime = classify_volatility_regime(vol_state.inputs)
+        vol_regime = states.volatility_regime
         vol_vec = volatility_feature_vector(vol_state, vol_regime)
 
         # Commodities
-        commod_state = build_commodities_state(settings=settings, start_date=start, refresh=refresh)
-        commod_regime = classify_commodities_regime(commod_state.inputs)
+        commod_regime = states.commodities_regime
         commod_vec = commodities_feature_vector(commod_state, commod_regime)
 
-        # Tariff basket selection
-        if baskets.strip().lower() == "all":
-            basket_names = list(BASKETS.keys())
-        else:
-            basket_names = [b.strip() for b in baskets.split(",") if b.strip()]
-        unknown = [b for b in basket_names if b not in BASKETS]
-        if unknown:
-            raise typer.BadParameter(f"Unknown basket(s): {unknown}. Choose from: {list(BASKETS.keys())}")
-
-        # Cost proxies (FRED) fetched once
-        if not settings.FRED_API_KEY:
-            raise RuntimeError("Missing FRED_API_KEY in environment / .env")
-        fred = FredClient(api_key=settings.FRED_API_KEY)
-        frames = []
-        for col, sid in DEFAULT_COST_PROXY_SERIES.items():
-            df = fred.fetch_series(sid, start_date=start, refresh=refresh)
-            df = df.rename(columns={"value": col}).set_index("date")
-            frames.append(df[[col]])
-        cost_df = pd.concat(frames, axis=1).sort_index().resample("D").ffill()
-
-        # Equities (historical closes; default: FMP) fetched once
-        all_universe = sorted({sym for b in basket_names for sym in BASKETS[b].tickers})
-        symbols = sorted(set(all_universe + [benchmark.strip().upper()]))
-        px = fetch_equity_daily_closes(settings=settings, symbols=symbols, start=start, refresh=bool(refresh))
         px = px.sort_index().ffill().dropna(how="all")
 
-        tariff_states = []
-        for b in basket_names:
-            basket = BASKETS[b]
-            state = build_tariff_regime_state(
-                cost_df=cost_df,
-                equity_prices=px,
-                universe=basket.tickers,
-                benchmark=benchmark,
-                basket_name=basket.name,
-                start_date=start,
-            )
-            tariff_states.append(state)
+        tariff_states = _build_tariff_states(
+            [BASKETS[b] for b in basket_names], cost_df=cost_df, px=px, benchmark=benchmark, start=start,
+        )
         tariff_vec = tariff_feature_vector(tariff_states, asof=tariff_states[-1].asof if tariff_states else macro_state.asof)
 
         # Merge into one flat mapping (floats only)
@@ -500,11 +560,11 @@ def register(app: typer.Typer) -> None:
             commod_vec.features,
             tariff_vec.features,
         )
-        out = {"asof": macro_state.asof, **{k: merged[k] for k in sorted(merged.keys())}}
+        features = dict(sorted(merged.items()))
 
-        if pretty:
-            print(json.dumps(out, indent=2, sort_keys=False))
+        if fmt == "json":
+            write_json_stdout({"asof": macro_state.asof, **features}, pretty=pretty)
         else:
-            print(json.dumps(out, separators=(",", ":"), sort_keys=False))
+            _write_feature_array(macro_state.asof, features, fmt=fmt)
 
 
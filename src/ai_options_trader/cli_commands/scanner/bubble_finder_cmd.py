@@ -4,11 +4,17 @@ Bubble Finder CLI command.
 
 from __future__ import annotations
 
+import io
+import operator
+from typing import TYPE_CHECKING
+
 import typer
-from rich import print
-from rich.panel import Panel
-from rich.table import Table
-from rich.console import Console
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Rich renderables are imported inside the functions that draw them, so registering this
+# command (and `--help` / completion) does not pay for them.
 
 
 def _run_bubble_finder(
@@ -19,8 +25,14 @@ def _run_bubble_finder(
     crashes_only: bool = False,
     show_reasons: bool = True,
     json_out: bool = False,
+    workers: int = 16,
 ):
     """Run the bubble finder scan."""
+    from rich import print
+    from rich.console import Console
+    from rich.panel import Panel
+
+    from ai_options_trader.cli_commands.shared.json_out import write_json_stdout
     from ai_options_trader.config import load_settings
     from ai_options_trader.scanner.bubble_finder import scan_for_bubbles
     
@@ -38,13 +50,13 @@ def _run_bubble_finder(
             include_news=show_reasons,
             include_earnings=show_reasons,
             top_n=top_n,
+            workers=workers,
         )
     except Exception as e:
         console.print(f"[red]Error scanning: {e}[/red]")
         return
     
     if json_out:
-        import json
         output = {
             "scan_date": result.scan_date.isoformat(),
             "universe": result.universe,
@@ -52,18 +64,18 @@ def _run_bubble_finder(
             "bubbles": [_candidate_to_dict(b) for b in result.bubbles],
             "crashes": [_candidate_to_dict(c) for c in result.crashes],
         }
-        print(json.dumps(output, indent=2))
+        write_json_stdout(output)
         return
     
     # Summary panel
-    summary_lines = [
+    summary = "\n".join((
         f"[bold]Scan Date:[/bold] {result.scan_date}",
         f"[bold]Universe:[/bold] {result.universe.upper()}",
         f"[bold]Stocks Scanned:[/bold] {result.total_scanned}",
         f"[bold]Bubbles Found:[/bold] [red]{result.bubble_count}[/red]",
         f"[bold]Crashes Found:[/bold] [green]{result.crash_count}[/green]",
-    ]
-    print(Panel("\n".join(summary_lines), title="Bubble Finder Results", expand=False))
+    ))
+    print(Panel(summary, title="Bubble Finder Results", expand=False))
     
     # Show bubbles (run-ups)
     if not crashes_only and result.bubbles:
@@ -79,33 +91,45 @@ def _run_bubble_finder(
         console.print("[dim]Try lowering --min-score or scanning a different universe.[/dim]")
 
 
+# BubbleCandidate attributes exposed in --json output, in output order.
+_CANDIDATE_FIELDS = (
+    "ticker",
+    "price",
+    "move_type",
+    "bubble_score",
+    "ret_5d_pct",
+    "ret_20d_pct",
+    "ret_60d_pct",
+    "zscore_20d",
+    "rsi_14",
+    "extension_pct",
+    "reversion_score",
+    "reversion_direction",
+    "has_recent_earnings",
+    "earnings_surprise_pct",
+    "has_recent_news",
+    "news_sentiment",
+    "trade_recommendation",
+    "confidence",
+)
+_get_candidate_fields = operator.attrgetter(*_CANDIDATE_FIELDS)
+
+
 def _candidate_to_dict(c) -> dict:
     """Convert candidate to dict for JSON output."""
-    return {
-        "ticker": c.ticker,
-        "price": c.price,
-        "move_type": c.move_type,
-        "bubble_score": c.bubble_score,
-        "ret_5d_pct": c.ret_5d_pct,
-        "ret_20d_pct": c.ret_20d_pct,
-        "ret_60d_pct": c.ret_60d_pct,
-        "zscore_20d": c.zscore_20d,
-        "rsi_14": c.rsi_14,
-        "extension_pct": c.extension_pct,
-        "reversion_score": c.reversion_score,
-        "reversion_direction": c.reversion_direction,
-        "has_recent_earnings": c.has_recent_earnings,
-        "earnings_surprise_pct": c.earnings_surprise_pct,
-        "has_recent_news": c.has_recent_news,
-        "news_sentiment": c.news_sentiment,
-        "trade_recommendation": c.trade_recommendation,
-        "confidence": c.confidence,
-    }
+    return dict(zip(_CANDIDATE_FIELDS, _get_candidate_fields(c)))
+
+
+# (min value, style) thresholds, checked in order; anything below the last one renders "dim".
+_REVERSION_STYLES = ((70, "green"), (50, "yellow"))
 
 
 def _show_candidates_table(candidates: list, move_type: str, console: Console, show_reasons: bool):
     """Display candidates in a rich table."""
-    
+    from rich import print
+    from rich.table import Table
+    from rich.text import Text
+
     if move_type == "bubble":
         title = "🫧 BUBBLE CANDIDATES (Run-Ups) 🫧"
         title_color = "red"
@@ -128,35 +152,28 @@ def _show_candidates_table(candidates: list, move_type: str, console: Console, s
     table.add_column("From\n200MA", justify="right")
     table.add_column("Reversion\nProb", justify="right")
     
+    # Same shape as _REVERSION_STYLES, applied to |bubble_score|.
+    score_styles = ((70, f"bold {score_color}"), (50, score_color))
+
     for c in candidates:
-        # Color coding
-        if abs(c.bubble_score) >= 70:
-            score_style = f"bold {score_color}"
-        elif abs(c.bubble_score) >= 50:
-            score_style = score_color
-        else:
-            score_style = "dim"
-        
-        rsi_style = "red" if c.rsi_14 > 70 else "green" if c.rsi_14 < 30 else "white"
-        
-        ret_20d_style = "red" if c.ret_20d_pct > 0 else "green"
-        ret_60d_style = "red" if c.ret_60d_pct > 0 else "green"
-        
-        reversion_style = "green" if c.reversion_score >= 70 else "yellow" if c.reversion_score >= 50 else "dim"
-        
-        # Format RSI without markup if neutral
-        rsi_str = f"[{rsi_style}]{c.rsi_14:.0f}[/{rsi_style}]" if rsi_style != "white" else f"{c.rsi_14:.0f}"
-        
+        score, rsi, ret_20d, ret_60d, reversion = (
+            c.bubble_score, c.rsi_14, c.ret_20d_pct, c.ret_60d_pct, c.reversion_score,
+        )
+        score_style = next((st for t, st in score_styles if abs(score) >= t), "dim")
+        reversion_style = next((st for t, st in _REVERSION_STYLES if reversion >= t), "dim")
+        rsi_style = "red" if rsi > 70 else "green" if rsi < 30 else None
+
+        # Styled cells are built as Text so rich skips its markup parser for every row.
         table.add_row(
             c.ticker,
             f"${c.price:.2f}",
-            f"[{score_style}]{c.bubble_score:+.0f}[/{score_style}]",
-            f"[{ret_20d_style}]{c.ret_20d_pct:+.1f}%[/{ret_20d_style}]",
-            f"[{ret_60d_style}]{c.ret_60d_pct:+.1f}%[/{ret_60d_style}]",
+            Text.assemble((f"{score:+.0f}", score_style)),
+            Text.assemble((f"{ret_20d:+.1f}%", "red" if ret_20d > 0 else "green")),
+            Text.assemble((f"{ret_60d:+.1f}%", "red" if ret_60d > 0 else "green")),
             f"{c.zscore_20d:+.1f}σ",
-            rsi_str,
+            Text.assemble((f"{rsi:.0f}", rsi_style)) if rsi_style else f"{rsi:.0f}",
             f"{c.extension_pct:+.0f}%",
-            f"[{reversion_style}]{c.reversion_score:.0f}%[/{reversion_style}]",
+            Text.assemble((f"{reversion:.0f}%", reversion_style)),
         )
     
     print()
@@ -170,50 +187,54 @@ def _show_candidates_table(candidates: list, move_type: str, console: Console, s
 
 def _show_detailed_analysis(candidates: list, move_type: str):
     """Show detailed analysis for each candidate."""
-    
-    lines = []
-    
+    from rich import print
+    from rich.panel import Panel
+
+    # One C-level buffer instead of a growing list; every write ends its own line.
+    buf = io.StringIO()
+    w = buf.write
+
     for i, c in enumerate(candidates[:5], 1):  # Top 5 with details
-        lines.append(f"[bold]{i}. {c.ticker}[/bold] - ${c.price:.2f}")
-        lines.append("")
+        w(f"[bold]{i}. {c.ticker}[/bold] - ${c.price:.2f}\n")
+        w("\n")
         
         # Move summary
         if move_type == "bubble":
-            lines.append(f"   [red]▲ UP {c.ret_20d_pct:+.1f}% (20d) | {c.ret_60d_pct:+.1f}% (60d)[/red]")
+            w(f"   [red]▲ UP {c.ret_20d_pct:+.1f}% (20d) | {c.ret_60d_pct:+.1f}% (60d)[/red]\n")
         else:
-            lines.append(f"   [green]▼ DOWN {c.ret_20d_pct:+.1f}% (20d) | {c.ret_60d_pct:+.1f}% (60d)[/green]")
+            w(f"   [green]▼ DOWN {c.ret_20d_pct:+.1f}% (20d) | {c.ret_60d_pct:+.1f}% (60d)[/green]\n")
         
-        lines.append(f"   Bubble Score: {c.bubble_score:+.0f} | Z-Score: {c.zscore_20d:+.1f}σ | RSI: {c.rsi_14:.0f}")
-        lines.append("")
+        w(f"   Bubble Score: {c.bubble_score:+.0f} | Z-Score: {c.zscore_20d:+.1f}σ | RSI: {c.rsi_14:.0f}\n")
+        w("\n")
         
         # Reason analysis
-        lines.append("   [bold]Possible Reasons:[/bold]")
+        w("   [bold]Possible Reasons:[/bold]\n")
         
         if c.has_recent_earnings:
             surprise = f" ({c.earnings_surprise_pct:+.1f}% surprise)" if c.earnings_surprise_pct else ""
-            lines.append(f"   • Recent earnings{surprise}")
+            w(f"   • Recent earnings{surprise}\n")
         
         if c.has_recent_news:
             sentiment = f" [{c.news_sentiment}]" if c.news_sentiment else ""
-            lines.append(f"   • News activity{sentiment}")
+            w(f"   • News activity{sentiment}\n")
         
         if not c.has_recent_earnings and not c.has_recent_news:
             if abs(c.zscore_20d) > 2:
-                lines.append("   • Technical/momentum driven (no clear catalyst)")
+                w("   • Technical/momentum driven (no clear catalyst)\n")
             else:
-                lines.append("   • Sector rotation or macro factors")
+                w("   • Sector rotation or macro factors\n")
         
-        lines.append("")
+        w("\n")
         
         # Reversion analysis
-        lines.append("   [bold]Reversion Analysis:[/bold]")
+        w("   [bold]Reversion Analysis:[/bold]\n")
         
         if c.reversion_score >= 70:
-            lines.append(f"   [green]★★★ HIGH probability ({c.reversion_score:.0f}%) of {c.reversion_direction} reversion[/green]")
+            w(f"   [green]★★★ HIGH probability ({c.reversion_score:.0f}%) of {c.reversion_direction} reversion[/green]\n")
         elif c.reversion_score >= 50:
-            lines.append(f"   [yellow]★★ MODERATE probability ({c.reversion_score:.0f}%) of {c.reversion_direction} reversion[/yellow]")
+            w(f"   [yellow]★★ MODERATE probability ({c.reversion_score:.0f}%) of {c.reversion_direction} reversion[/yellow]\n")
         else:
-            lines.append(f"   [dim]★ LOW probability ({c.reversion_score:.0f}%) - move may continue[/dim]")
+            w(f"   [dim]★ LOW probability ({c.reversion_score:.0f}%) - move may continue[/dim]\n")
         
         # Trade recommendation
         if c.trade_recommendation:
@@ -223,13 +244,14 @@ def _show_detailed_analysis(candidates: list, move_type: str):
                 rec_style = "yellow"
             else:
                 rec_style = "dim"
-            lines.append(f"   [{rec_style}]→ {c.trade_recommendation} (Confidence: {c.confidence:.0f}%)[/{rec_style}]")
+            w(f"   [{rec_style}]→ {c.trade_recommendation} (Confidence: {c.confidence:.0f}%)[/{rec_style}]\n")
         
-        lines.append("")
-        lines.append("   " + "─" * 50)
-        lines.append("")
+        w("\n")
+        w("   " + "─" * 50 + "\n")
+        w("\n")
     
-    print(Panel("\n".join(lines), title="Detailed Analysis", expand=False))
+    text = buf.getvalue()
+    print(Panel(text[:-1] if text else text, title="Detailed Analysis", expand=False))
 
 
 def register(labs_app: typer.Typer) -> None:
@@ -244,6 +266,7 @@ def register(labs_app: typer.Typer) -> None:
         crashes_only: bool = typer.Option(False, "--crashes", help="Show only crashes (run-downs)"),
         no_reasons: bool = typer.Option(False, "--no-reasons", help="Skip news/earnings lookup (faster)"),
         json_out: bool = typer.Option(False, "--json", help="Output as JSON"),
+        workers: int = typer.Option(16, "--workers", "-w", help="Concurrent price-batch downloads"),
     ):
         """
         Find stocks with extreme run-ups (bubbles) or run-downs (crashes).
@@ -265,4 +288,5 @@ def register(labs_app: typer.Typer) -> None:
             crashes_only=crashes_only,
             show_reasons=not no_reasons,
             json_out=json_out,
+            workers=workers,
         )
@@ -0,0 +1,30 @@
+"""Machine-readable (``--json``) output for CLI commands."""
+from __future__ import annotations
+
+import sys
+from typing import Any, Callable
+
+
+def write_json_stdout(obj: Any, *, pretty: bool = True, default: Callable[[Any], Any] | None = None) -> None:
+    """Write `obj` as JSON to stdout (orjson when installed, else stdlib json).
+
+    Writes bypass rich's print, which would re-scan (and soft-wrap) the JSON text.
+    """
+    sys.stdout.flush()
+    try:
+        import orjson
+    except ImportError:
+        import json
+        # Stream straight to stdout rather than materializing the full text first.
+        json.dump(
+            obj,
+            sys.stdout,
+            indent=2 if pretty else None,
+            separators=None if pretty else (",", ":"),
+            default=default,
+        )
+        sys.stdout.write("\n")
+        return
+    opts = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+    sys.stdout.buffer.write(orjson.dumps(obj, option=opts, default=default) + b"\n")
+    sys.stdout.buffer.flush()
@@ -0,0 +1,15 @@
+"""Parsing of user-supplied ticker / sleeve lists for CLI options."""
+from __future__ import annotations
+
+import re
+
+# Comma- and/or whitespace-separated lists (e.g. "AAPL, msft NVDA").
+_LIST_SEP = re.compile(r"[,\s]+")
+
+
+def split_symbols(text: str | None, *, upper: bool = True) -> list[str]:
+    """Split a comma- and/or whitespace-separated list, dropping empties (upper-cased by default)."""
+    s = (text or "").strip()
+    if upper:
+        s = s.upper()
+    return [x for x in _LIST_SEP.split(s) if x]
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
+    # Read-only, environment-derived config: frozen (and therefore hashable) so the cached
+    # `load_settings()` instance can be shared safely; defaults are trusted, not re-validated.
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True,
+        validate_default=False,
+    )
 
     # Historical price source used by research panels/backtests.
     # Alpaca remains the execution + options chain provider.
@@ -97,5 +107,11 @@ class RiskConfig(BaseModel):
     max_contracts: int = 20
     max_premium_per_contract: float | None = None  # e.g., 5.00 means $500/contract
 
+@lru_cache(maxsize=1)
 def load_settings() -> Settings:
+    """
+    Process-wide Settings (`.env` + environment are parsed and validated once).
+
+    Call `load_settings.cache_clear()` to pick up environment changes (e.g. in tests).
+    """
     return Settings()
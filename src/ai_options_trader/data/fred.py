@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -143,5 +145,8 @@ class FredClient:
         df["date"] = pd.to_datetime(df["date"])
         df = df.sort_values("date").reset_index(drop=True)
 
-        df.to_csv(cache_path, index=False)
+        # Write-then-rename so concurrent fetches of the same series never read a partial CSV.
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        df.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, cache_path)
         return df[df["date"] >= start_ts].reset_index(drop=True)
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+TTL'd cache around `fetch_option_chain`.
+
+Option chains are cached twice:
+- in-process (so repeated lookups for the same ticker within one command are free)
+- on disk under `$AOT_CACHE_DIR/option_chains/{YYYY-MM-DD}/{TICKER}_{feed}.pkl`
+  (so back-to-back `moonshot` / scanner runs in a session skip the Alpaca round-trip)
+
+Entries are keyed by (ticker, as-of date, feed) and expire after `ttl`.
+"""
+from __future__ import annotations
+
+import os
+import pickle
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from ai_options_trader.data.alpaca import fetch_option_chain
+
+DEFAULT_CHAIN_TTL = timedelta(minutes=15)
+
+_MEMO: dict[tuple[str, str, str], tuple[float, dict[str, Any]]] = {}
+_LOCK = threading.Lock()
+
+
+def _cache_path(ticker: str, asof: date, feed: str) -> Path:
+    root = Path(os.environ.get("AOT_CACHE_DIR", "data/cache"))
+    return root / "option_chains" / asof.isoformat() / f"{ticker}_{feed}.pkl"
+
+
+def _read_disk(path: Path, *, max_age_s: float) -> tuple[float, dict[str, Any]] | None:
+    try:
+        if not path.exists():
+            return None
+        mtime = path.stat().st_mtime
+        if time.time() - mtime > max_age_s:
+            return None
+        with path.open("rb") as f:
+            return mtime, pickle.load(f)
+    except Exception:
+        return None
+
+
+def _write_disk(path: Path, chain: dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump(chain, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        # Cache writes are best-effort (e.g. unpicklable SDK objects, read-only FS).
+        pass
+
+
+def cached_fetch_option_chain(
+    data_client: Any,
+    ticker: str,
+    *,
+    feed: str | None = None,
+    ttl: timedelta = DEFAULT_CHAIN_TTL,
+    refresh: bool = False,
+    asof: date | None = None,
+) -> dict[str, Any]:
+    """
+    Same contract as `fetch_option_chain`, but served from cache when a fresh entry exists.
+
+    `refresh=True` bypasses both cache layers for this call and re-populates them.
+    """
+    t = ticker.strip().upper()
+    feed_key = (feed or "default").strip().lower()
+    asof = asof or date.today()
+    key = (t, asof.isoformat(), feed_key)
+    max_age_s = ttl.total_seconds()
+
+    if not refresh:
+        with _LOCK:
+            hit = _MEMO.get(key)
+        if hit is not None and time.time() - hit[0] <= max_age_s:
+            return hit[1]
+
+    path = _cache_path(t, asof, feed_key)
+    entry = None if refresh else _read_disk(path, max_age_s=max_age_s)
+    if entry is None:
+        chain = fetch_option_chain(data_client, t, feed=feed)
+        _write_disk(path, chain)
+        entry = (time.time(), chain)
+
+    with _LOCK:
+        _MEMO[key] = entry
+    return entry[1]
+
+
+def clear_option_chain_memo() -> None:
+    """Drop the in-process layer (the on-disk layer expires on its own)."""
+    with _LOCK:
+        _MEMO.clear()
@@ -0,0 +1,89 @@
+"""
+Per-symbol TTL cache around `fetch_equity_daily_closes`.
+
+Regime/tariff commands request overlapping symbol sets (e.g. `--baskets all` vs a single basket,
+different benchmarks). Caching closes per symbol at
+`$AOT_CACHE_DIR/px/{SYMBOL}-{start}.csv` lets any later request reuse whichever columns are
+already fresh on disk and only download the missing ones.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+
+DEFAULT_PX_TTL = timedelta(hours=12)
+
+
+def _cache_path(symbol: str, start: str) -> Path:
+    root = Path(os.environ.get("AOT_CACHE_DIR", "data/cache"))
+    safe = f"{symbol}-{str(start).strip()}".replace("/", "_").replace(":", "_")
+    return root / "px" / f"{safe}.csv"
+
+
+def _read_fresh(path: Path, *, max_age_s: float) -> pd.Series | None:
+    try:
+        if not path.exists() or time.time() - path.stat().st_mtime > max_age_s:
+            return None
+        s = pd.read_csv(path, index_col=0, parse_dates=[0]).iloc[:, 0]
+        return s if not s.empty else None
+    except Exception:
+        return None
+
+
+def _write(path: Path, s: pd.Series) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        s.dropna().rename_axis("date").to_csv(tmp, header=True)
+        os.replace(tmp, path)
+    except Exception:
+        # Cache writes are best-effort (read-only FS, etc.).
+        pass
+
+
+def cached_equity_daily_closes(
+    *,
+    settings: Any,
+    symbols: list[str],
+    start: str,
+    refresh: bool = False,
+    ttl: timedelta = DEFAULT_PX_TTL,
+    fetcher: Callable[..., pd.DataFrame] | None = None,
+) -> pd.DataFrame:
+    """
+    Same contract as `fetch_equity_daily_closes` (date index, one close column per symbol),
+    but only symbols without a fresh per-symbol cache entry hit the network.
+    """
+    if fetcher is None:
+        from ai_options_trader.data.market import fetch_equity_daily_closes as fetcher
+
+    syms = list(dict.fromkeys(s.strip().upper() for s in (symbols or []) if s and s.strip()))
+    if not syms:
+        return pd.DataFrame()
+
+    max_age_s = ttl.total_seconds()
+    cols: dict[str, pd.Series] = {}
+    if not refresh:
+        for sym in syms:
+            s = _read_fresh(_cache_path(sym, start), max_age_s=max_age_s)
+            if s is not None:
+                cols[sym] = s
+
+    missing = [s for s in syms if s not in cols]
+    if missing:
+        fresh = fetcher(settings=settings, symbols=missing, start=start, refresh=bool(refresh))
+        for sym in missing:
+            if sym in fresh.columns:
+                s = fresh[sym].dropna()
+                _write(_cache_path(sym, start), s)
+                cols[sym] = s
+
+    px = pd.DataFrame({s: cols[s] for s in syms if s in cols}).sort_index()
+    px.index = pd.to_datetime(px.index)
+    return px
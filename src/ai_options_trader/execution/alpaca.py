@@ -29,6 +29,35 @@ class CryptoOrderPreview:
     tif: str = "day"
 
 
+# Side is keyed on its first letter ("b..." -> BUY, anything else -> SELL);
+# TIF is "day" -> DAY, anything else -> GTC.
+_SIDE = {"b": OrderSide.BUY, "s": OrderSide.SELL}
+_TIF = {"day": TimeInForce.DAY, "gtc": TimeInForce.GTC}
+
+
+def _order_enums(side: str, tif: str) -> tuple[OrderSide, TimeInForce]:
+    return _SIDE.get(side[:1].lower(), OrderSide.SELL), _TIF.get(tif.lower(), TimeInForce.GTC)
+
+
+def _build_order(
+    symbol: str,
+    qty: int,
+    side_enum: OrderSide,
+    tif_enum: TimeInForce,
+    limit_price: float | None,
+) -> MarketOrderRequest | LimitOrderRequest:
+    """Market order when `limit_price` is None, else a limit order at `limit_price` (2dp)."""
+    if limit_price is None:
+        return MarketOrderRequest(symbol=symbol, qty=qty, side=side_enum, time_in_force=tif_enum)
+    return LimitOrderRequest(
+        symbol=symbol,
+        qty=qty,
+        side=side_enum,
+        time_in_force=tif_enum,
+        limit_price=round(float(limit_price), 2),
+    )
+
+
 def submit_option_order(
     *,
     trading: TradingClient,
@@ -43,21 +72,8 @@ def submit_option_order(
 
     Note: For safety, call this only after explicit user confirmation.
     """
-    side_enum = OrderSide.BUY if side.lower().startswith("b") else OrderSide.SELL
-    tif_enum = TimeInForce.DAY if tif.lower() == "day" else TimeInForce.GTC
-
-    if limit_price is None:
-        req = MarketOrderRequest(symbol=symbol, qty=qty, side=side_enum, time_in_force=tif_enum)
-    else:
-        req = LimitOrderRequest(
-            symbol=symbol,
-            qty=qty,
-            side=side_enum,
-            time_in_force=tif_enum,
-            limit_price=round(float(limit_price), 2),
-        )
-
-    return trading.submit_order(order_data=req)
+    side_enum, tif_enum = _order_enums(side, tif)
+    return trading.submit_order(order_data=_build_order(symbol, qty, side_enum, tif_enum, limit_price))
 
 
 def submit_equity_order(
@@ -74,21 +90,8 @@ def submit_equity_order(
 
     Note: For safety, call this only after explicit user confirmation.
     """
-    side_enum = OrderSide.BUY if side.lower().startswith("b") else OrderSide.SELL
-    tif_enum = TimeInForce.DAY if tif.lower() == "day" else TimeInForce.GTC
-
-    if limit_price is None:
-        req = MarketOrderRequest(symbol=symbol, qty=qty, side=side_enum, time_in_force=tif_enum)
-    else:
-        req = LimitOrderRequest(
-            symbol=symbol,
-            qty=qty,
-            side=side_enum,
-            time_in_force=tif_enum,
-            limit_price=round(float(limit_price), 2),
-        )
-
-    return trading.submit_order(order_data=req)
+    side_enum, tif_enum = _order_enums(side, tif)
+    return trading.submit_order(order_data=_build_order(symbol, qty, side_enum, tif_enum, limit_price))
 
 
 def submit_equity_notional_order(
@@ -106,8 +109,7 @@ def submit_equity_notional_order(
     - Alpaca supports fractional shares for eligible equities/ETFs via notional.
     - Some SDK versions may not accept `notional` on MarketOrderRequest; callers should catch TypeError.
     """
-    side_enum = OrderSide.BUY if side.lower().startswith("b") else OrderSide.SELL
-    tif_enum = TimeInForce.DAY if tif.lower() == "day" else TimeInForce.GTC
+    side_enum, tif_enum = _order_enums(side, tif)
     req = MarketOrderRequest(symbol=symbol, notional=round(float(notional), 2), side=side_enum, time_in_force=tif_enum)
     return trading.submit_order(order_data=req)
 
@@ -130,8 +132,7 @@ def submit_crypto_order(
     - For closes, prefer QTY to sell the entire position.
     - Some Alpaca SDK versions may not support `notional` on MarketOrderRequest; in that case, pass `qty`.
     """
-    side_enum = OrderSide.BUY if side.lower().startswith("b") else OrderSide.SELL
-    tif_enum = TimeInForce.DAY if tif.lower() == "day" else TimeInForce.GTC
+    side_enum, tif_enum = _order_enums(side, tif)
 
     if limit_price is not None:
         # Crypto limit orders: rely on standard LimitOrderRequest.
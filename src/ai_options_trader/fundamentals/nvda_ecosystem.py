@@ -10,13 +10,33 @@ Comprehensive list of all public companies with direct NVDA relationships:
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional, Literal
-from datetime import datetime
-import requests
+from typing import TYPE_CHECKING, Iterator, Optional, Literal
+from datetime import date, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+import numpy as np
 
 from ai_options_trader.config import Settings
 
+try:
+    # Parses the raw response bytes directly; stdlib json (which also accepts bytes) otherwise.
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger(__name__)
+
 
 # Complete NVDA ecosystem with relationship types
 NVDA_ECOSYSTEM = {
@@ -417,52 +437,83 @@ NVDA_DEPENDENT_TICKERS = {
     },
 }
 
+# Columns of NVDA_ECOSYSTEM that basket membership is filtered on, aligned by index with
+# ECOSYSTEM_TICKERS (each basket mask reads a single column)
+ECOSYSTEM_TICKERS: tuple[str, ...] = tuple(NVDA_ECOSYSTEM)
+ECOSYSTEM_RELATIONSHIPS = np.array([v["relationship"] for v in NVDA_ECOSYSTEM.values()])
+ECOSYSTEM_CATEGORIES = np.array([v["category"] for v in NVDA_ECOSYSTEM.values()])
+ECOSYSTEM_REVENUE_TO_NVDA = np.array(
+    [bool(v.get("revenue_to_nvda", False)) for v in NVDA_ECOSYSTEM.values()], dtype=bool
+)
+
+
+def _select(mask: np.ndarray) -> tuple[str, ...]:
+    """Tickers where `mask` (aligned with ECOSYSTEM_TICKERS) is true, in ecosystem order."""
+    return tuple(ECOSYSTEM_TICKERS[i] for i in np.flatnonzero(mask))
+
+
 # Basket definitions for different strategies
 NVDA_BASKETS = {
     "all": {
         "name": "Complete NVDA Ecosystem",
         "description": "All companies with NVDA relationships",
-        "tickers": list(NVDA_ECOSYSTEM.keys()),
+        "tickers": ECOSYSTEM_TICKERS,
     },
     "investments": {
         "name": "NVDA Direct Investments",
         "description": "Companies NVDA has equity stakes in",
-        "tickers": [t for t, v in NVDA_ECOSYSTEM.items() if v["relationship"] == "investment"],
+        "tickers": _select(ECOSYSTEM_RELATIONSHIPS == "investment"),
     },
     "customers": {
         "name": "NVDA GPU Customers",
         "description": "Companies that buy NVDA GPUs",
-        "tickers": [t for t, v in NVDA_ECOSYSTEM.items() if v.get("revenue_to_nvda", False)],
+        "tickers": _select(ECOSYSTEM_REVENUE_TO_NVDA),
     },
     "suppliers": {
         "name": "NVDA Supply Chain",
         "description": "Companies that supply to NVDA",
-        "tickers": [t for t, v in NVDA_ECOSYSTEM.items() if v["relationship"] == "supplier"],
+        "tickers": _select(ECOSYSTEM_RELATIONSHIPS == "supplier"),
     },
     "hyperscalers": {
         "name": "Hyperscaler Customers",
         "description": "Big tech GPU buyers",
-        "tickers": [t for t, v in NVDA_ECOSYSTEM.items() if v["category"] == "hyperscaler"],
+        "tickers": _select(ECOSYSTEM_CATEGORIES == "hyperscaler"),
     },
     "bear_thesis": {
         "name": "Bear Thesis Basket",
         "description": "Key tickers for the AI demand bear thesis",
-        "tickers": ["CRWV", "MSFT", "META", "ORCL", "TSM", "SMCI"],
+        "tickers": ("CRWV", "MSFT", "META", "ORCL", "TSM", "SMCI"),
     },
     "dependent": {
         "name": "NVDA-Dependent Pure Plays",
         "description": "Companies that NEED NVDA/AI to survive - no fallback business",
-        "tickers": list(NVDA_DEPENDENT_TICKERS.keys()),
+        "tickers": tuple(NVDA_DEPENDENT_TICKERS),
     },
     "critical": {
         "name": "Critically NVDA-Dependent",
         "description": "Would collapse without NVDA/AI demand",
-        "tickers": [t for t, v in NVDA_DEPENDENT_TICKERS.items() if v["dependency"] == "critical"],
+        "tickers": tuple(
+            t for t, v in NVDA_DEPENDENT_TICKERS.items() if v["dependency"] == "critical"
+        ),
     },
 }
 
 
-@dataclass
+# Reverse index: ticker -> names of every basket it belongs to
+TICKER_BASKETS: dict[str, frozenset[str]] = {}
+for _name, _b in NVDA_BASKETS.items():
+    for _t in _b["tickers"]:
+        TICKER_BASKETS[_t] = TICKER_BASKETS.get(_t, frozenset()) | {_name}
+del _name, _b, _t
+
+# Read-only views: these are constants shared by cached helpers and quote-fetch threads
+NVDA_ECOSYSTEM = MappingProxyType(NVDA_ECOSYSTEM)
+NVDA_DEPENDENT_TICKERS = MappingProxyType(NVDA_DEPENDENT_TICKERS)
+NVDA_BASKETS = MappingProxyType(NVDA_BASKETS)
+TICKER_BASKETS = MappingProxyType(TICKER_BASKETS)
+
+
+@dataclass(slots=True)
 class EcosystemTicker:
     """A ticker in the NVDA ecosystem."""
     
@@ -491,7 +542,7 @@ class EcosystemTicker:
     nvda_correlation_30d: float = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class EcosystemReport:
     """NVDA ecosystem analysis report."""
     
@@ -516,18 +567,165 @@ class EcosystemReport:
     by_relationship: dict = field(default_factory=dict)
 
 
-def get_basket_tickers(basket: str = "all") -> list[str]:
-    """Get list of tickers for a specific basket."""
-    if basket in NVDA_BASKETS:
-        return NVDA_BASKETS[basket]["tickers"]
-    return NVDA_BASKETS["all"]["tickers"]
+def iter_basket(basket: str) -> Iterator[str]:
+    """Iterate a basket's tickers; a thin accessor over get_basket_tickers (same "all" fallback)."""
+    return iter(get_basket_tickers(basket))
+
+
+@lru_cache(maxsize=32)
+def get_basket_tickers(basket: str = "all") -> tuple[str, ...]:
+    """Get the tickers for a specific basket (unknown baskets fall back to "all")."""
+    return NVDA_BASKETS.get(basket, NVDA_BASKETS["all"])["tickers"]
 
 
+@lru_cache(maxsize=64)
 def get_ticker_info(ticker: str) -> dict:
-    """Get NVDA ecosystem info for a ticker."""
+    """Get NVDA ecosystem info for a ticker (shared, treat as read-only)."""
     return NVDA_ECOSYSTEM.get(ticker.upper(), {})
 
 
+def get_baskets_for_ticker(ticker: str) -> frozenset[str]:
+    """Names of the baskets `ticker` belongs to (empty if it is in none)."""
+    return TICKER_BASKETS.get(ticker.upper(), frozenset())
+
+
+FMP_QUOTE_URL = "https://financialmodelingprep.com/api/v3/quote"
+
+# Symbols per /quote request (keeps the comma-separated URL well under length limits)
+_QUOTE_BATCH = 20
+
+
+# Concurrent /quote batch requests
+_QUOTE_WORKERS = 16
+
+# Statuses meaning the batch request itself was the problem (URL too long / malformed), so its
+# symbols are worth retrying one at a time. Anything else (429, 5xx, bad key, network) would
+# fail per symbol too, and the session already retried 429/5xx.
+_BATCH_REJECTED_STATUSES = frozenset({400, 414})
+# Per-symbol fallback stays gentle on the API
+_QUOTE_FALLBACK_WORKERS = 2
+
+# Per-symbol quote cache (parsed quote dicts), shared across reports in a session
+_QUOTE_TTL = timedelta(seconds=60)
+_QUOTE_MEMO: dict[str, tuple[float, dict]] = {}
+_QUOTE_LOCK = threading.Lock()
+
+# Shared keep-alive session: quote requests reuse pooled connections instead of a fresh
+# TCP+TLS handshake each, with the pool sized to the worker count. Built on first use so
+# importing the ecosystem data does not pay for importing requests/urllib3.
+_SESSION: requests.Session | None = None
+
+
+def _session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=_QUOTE_WORKERS,
+                max_retries=Retry(
+                    total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)
+                ),
+            ),
+        )
+        _SESSION = session
+    return _SESSION
+
+
+def _fetch_quote_batch(
+    session: requests.Session, settings: Settings, symbols: list[str]
+) -> tuple[list[dict] | None, bool]:
+    """
+    One /quote/{A,B,...} request -> (rows, rejected).
+    
+    `rows` is None when the request fails; `rejected` is True only when the failure status
+    says the batch itself was refused (see `_BATCH_REJECTED_STATUSES`).
+    """
+    from requests.exceptions import RequestException
+    
+    try:
+        resp = session.get(
+            f"{FMP_QUOTE_URL}/{','.join(symbols)}",
+            params={"apikey": settings.fmp_api_key},
+            timeout=20,
+        )
+        if not resp.ok:
+            logger.debug("quote fetch failed for %s: HTTP %s", symbols, resp.status_code)
+            return None, resp.status_code in _BATCH_REJECTED_STATUSES
+        rows = _json_loads(resp.content) or []
+        return [q for q in rows if isinstance(q, dict) and q.get("symbol")], False
+    except (RequestException, ValueError, TypeError) as e:
+        logger.debug("quote fetch failed for %s: %s", symbols, e)
+        return None, False
+
+
+def _fetch_quotes(settings: Settings, symbols: list[str]) -> dict[str, dict]:
+    """
+    Fetch FMP quotes for `symbols` with one /quote/{A,B,...} request per batch.
+    
+    Quotes fetched within the last `_QUOTE_TTL` are served from memory, so only the
+    missing symbols hit the network (baskets overlap heavily). Batches run concurrently;
+    only symbols from a batch the API refused as a batch (400/414) are retried one per
+    request, at low concurrency. Other failures are not retried here.
+    Returns symbol -> raw quote dict; symbols that fail or are missing are simply absent.
+    """
+    syms = list(dict.fromkeys(symbols))
+    if not syms:
+        return {}
+    
+    quotes: dict[str, dict] = {}
+    now = time.time()
+    max_age_s = _QUOTE_TTL.total_seconds()
+    with _QUOTE_LOCK:
+        for sym in syms:
+            hit = _QUOTE_MEMO.get(sym)
+            if hit is not None and now - hit[0] <= max_age_s:
+                quotes[sym] = hit[1]
+    
+    missing = [s for s in syms if s not in quotes]
+    if not missing:
+        return quotes
+    chunks = [missing[i:i + _QUOTE_BATCH] for i in range(0, len(missing), _QUOTE_BATCH)]
+    session = _session()
+    
+    with ThreadPoolExecutor(max_workers=min(_QUOTE_WORKERS, len(chunks))) as ex:
+        results = list(ex.map(lambda c: _fetch_quote_batch(session, settings, c), chunks))
+    
+    retry = [s for c, (_, rejected) in zip(chunks, results) if rejected for s in c]
+    if retry:
+        with ThreadPoolExecutor(max_workers=min(_QUOTE_FALLBACK_WORKERS, len(retry))) as ex:
+            results += list(ex.map(lambda s: _fetch_quote_batch(session, settings, [s]), retry))
+    batches = [rows for rows, _ in results]
+    
+    # Intern the parsed symbols so memo / report lookups by the (interned) ticker constants
+    # hit the identity fast path, and repeated fetches share one key object per symbol
+    fetched = {sys.intern(q["symbol"]): q for rows in batches for q in rows or []}
+    fetched_at = time.time()
+    with _QUOTE_LOCK:
+        for sym, q in fetched.items():
+            _QUOTE_MEMO[sym] = (fetched_at, q)
+    quotes.update(fetched)
+    return quotes
+
+
+def clear_quote_memo() -> None:
+    """Drop the in-process quote cache."""
+    with _QUOTE_LOCK:
+        _QUOTE_MEMO.clear()
+
+
+@lru_cache(maxsize=1)
+def _today_key(day_ordinal: int) -> str:
+    """YYYY-MM-DD for `day_ordinal`; keyed on the ordinal so it is formatted once per day."""
+    return date.fromordinal(day_ordinal).isoformat()
+
+
 def build_ecosystem_report(
     settings: Settings,
     basket: str = "all",
@@ -538,27 +736,17 @@ def build_ecosystem_report(
     tickers = basket_info["tickers"]
     
     report = EcosystemReport(
-        as_of=datetime.now().strftime("%Y-%m-%d"),
+        as_of=_today_key(date.today().toordinal()),
         basket_name=basket_info["name"],
     )
     
-    base_url = "https://financialmodelingprep.com/api/v3"
+    # One batched quote pass covers NVDA (always first) and every basket ticker;
+    # NVDA is not a basket member, so it is popped off as the reference quote
+    quotes = _fetch_quotes(settings, ["NVDA", *tickers])
+    nvda_q = quotes.pop("NVDA", {})
+    report.nvda_price = nvda_q.get("price", 0)
+    report.nvda_return_1d = nvda_q.get("changesPercentage", 0)
     
-    # Fetch NVDA first
-    try:
-        resp = requests.get(
-            f"{base_url}/quote/NVDA",
-            params={"apikey": settings.fmp_api_key},
-            timeout=15,
-        )
-        if resp.ok and resp.json():
-            nvda = resp.json()[0]
-            report.nvda_price = nvda.get("price", 0)
-            report.nvda_return_1d = nvda.get("changesPercentage", 0)
-    except Exception:
-        pass
-    
-    # Fetch each ticker
     for ticker in tickers:
         info = NVDA_ECOSYSTEM.get(ticker, {})
         
@@ -573,60 +761,64 @@ def build_ecosystem_report(
             nvda_revenue_impact=info.get("nvda_revenue_impact", "none"),
         )
         
-        # Fetch quote
-        try:
-            resp = requests.get(
-                f"{base_url}/quote/{ticker}",
-                params={"apikey": settings.fmp_api_key},
-                timeout=10,
-            )
-            if resp.ok and resp.json():
-                q = resp.json()[0]
+        q = quotes.get(ticker)
+        if q:
+            try:
                 et.price = q.get("price", 0)
                 et.market_cap = q.get("marketCap", 0) / 1e9
                 et.return_1d = q.get("changesPercentage", 0)
-        except Exception:
-            pass
+            except (TypeError, ValueError) as e:
+                logger.debug("bad quote for %s: %s", ticker, e)
         
         report.tickers.append(et)
     
     # Calculate averages
     if report.tickers:
-        report.avg_return_1d = sum(t.return_1d for t in report.tickers) / len(report.tickers)
+        returns_1d = np.fromiter(
+            (t.return_1d for t in report.tickers), dtype=np.float64, count=len(report.tickers)
+        )
+        report.avg_return_1d = float(returns_1d.mean())
     
-    # Group by category
+    # Group by category / relationship
+    by_cat: defaultdict[str, list[str]] = defaultdict(list)
+    by_rel: defaultdict[str, list[str]] = defaultdict(list)
     for t in report.tickers:
-        if t.category not in report.by_category:
-            report.by_category[t.category] = []
-        report.by_category[t.category].append(t.ticker)
-        
-        if t.relationship not in report.by_relationship:
-            report.by_relationship[t.relationship] = []
-        report.by_relationship[t.relationship].append(t.ticker)
+        by_cat[t.category].append(t.ticker)
+        by_rel[t.relationship].append(t.ticker)
+    report.by_category = dict(by_cat)
+    report.by_relationship = dict(by_rel)
     
     return report
 
 
+async def build_ecosystem_report_async(
+    settings: Settings,
+    basket: str = "all",
+) -> EcosystemReport:
+    """
+    Awaitable `build_ecosystem_report` for async callers.
+    
+    The quote fetch is already batched and concurrent on a pooled session, so this just
+    runs the builder in a worker thread to keep the event loop free.
+    """
+    return await asyncio.to_thread(build_ecosystem_report, settings, basket)
+
+
+@lru_cache(maxsize=1)
 def get_ecosystem_summary() -> dict:
-    """Get summary of NVDA ecosystem."""
+    """Get summary of NVDA ecosystem (computed once; treat as read-only)."""
+    
+    by_rel: defaultdict[str, list[str]] = defaultdict(list)
+    by_cat: defaultdict[str, list[str]] = defaultdict(list)
+    for ticker, info in NVDA_ECOSYSTEM.items():
+        by_rel[info["relationship"]].append(ticker)
+        by_cat[info["category"]].append(ticker)
     
     summary = {
         "total_tickers": len(NVDA_ECOSYSTEM),
-        "by_relationship": {},
-        "by_category": {},
+        "by_relationship": dict(by_rel),
+        "by_category": dict(by_cat),
         "baskets": list(NVDA_BASKETS.keys()),
     }
     
-    for ticker, info in NVDA_ECOSYSTEM.items():
-        rel = info["relationship"]
-        cat = info["category"]
-        
-        if rel not in summary["by_relationship"]:
-            summary["by_relationship"][rel] = []
-        summary["by_relationship"][rel].append(ticker)
-        
-        if cat not in summary["by_category"]:
-            summary["by_category"][cat] = []
-        summary["by_category"][cat].append(ticker)
-    
     return summary
@@ -13,13 +13,18 @@ and if it fails or scales back, these companies take the hit.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Optional, Literal
-from datetime import datetime
-import requests
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Optional, Literal
+from datetime import datetime, timedelta
 
+from ai_options_trader.altdata.cache import cache_path, read_cache, write_cache
 from ai_options_trader.config import Settings
 
+if TYPE_CHECKING:
+    import requests
+
 
 # OpenAI financial estimates (private company, estimates from press reports)
 OPENAI_FINANCIALS = {
@@ -236,8 +241,9 @@ class OpenAIExposureReport:
     # OpenAI health
     openai_health: OpenAIHealth = None
     
-    # Exposed companies
+    # Exposed companies (plus a ticker index over them)
     exposed_companies: list[CompanyOpenAIExposure] = field(default_factory=list)
+    by_ticker: dict[str, CompanyOpenAIExposure] = field(default_factory=dict, repr=False)
     
     # Disruption targets
     disruption_risks: list[dict] = field(default_factory=list)
@@ -251,10 +257,10 @@ class OpenAIExposureReport:
     thesis_implications: list[str] = field(default_factory=list)
 
 
-def build_openai_health_estimate() -> OpenAIHealth:
-    """Build estimated health profile for OpenAI."""
+def _compute_static_health() -> OpenAIHealth:
+    """Health profile from the static estimates above (everything except `as_of`)."""
     
-    health = OpenAIHealth(as_of=datetime.now().strftime("%Y-%m-%d"))
+    health = OpenAIHealth(as_of="")
     
     # Pull from our estimates
     health.valuation = OPENAI_FINANCIALS["valuation"]
@@ -303,8 +309,101 @@ def build_openai_health_estimate() -> OpenAIHealth:
     return health
 
 
-def fetch_company_exposure(settings: Settings, ticker: str) -> CompanyOpenAIExposure:
-    """Fetch financial data and calculate OpenAI exposure for a company."""
+# Depends only on module constants, so it is computed once at import
+_STATIC_HEALTH = _compute_static_health()
+
+
+def build_openai_health_estimate(as_of: str | None = None) -> OpenAIHealth:
+    """Build estimated health profile for OpenAI (`as_of` defaults to today)."""
+    return replace(
+        _STATIC_HEALTH,
+        as_of=as_of or datetime.now().strftime("%Y-%m-%d"),
+        key_risks=list(_STATIC_HEALTH.key_risks),
+    )
+
+
+FMP_BASE_URL = "https://financialmodelingprep.com/api/v3"
+
+# Shared keep-alive session so the profile / income-statement calls (issued from the report's
+# worker threads) reuse pooled connections instead of a fresh TCP+TLS handshake each.
+# Built on first use so importing the static exposure data doesn't set up an HTTP pool.
+_SESSION: requests.Session | None = None
+
+
+def _session() -> requests.Session:
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+        _SESSION = session
+    return _SESSION
+
+
+# Profiles move at most daily; annual income statements far less often
+PROFILE_CACHE_MAX_AGE = timedelta(hours=24)
+INCOME_CACHE_MAX_AGE = timedelta(days=7)
+
+
+def _fmp_get_cached(
+    settings: Settings,
+    path: str,
+    *,
+    params: dict | None = None,
+    max_age: timedelta,
+) -> Any | None:
+    """
+    GET `{FMP_BASE_URL}/{path}` and return the parsed JSON, served from the altdata JSON
+    cache when a response younger than `max_age` exists. Non-empty responses are cached.
+    """
+    params = params or {}
+    key_src = f"{path}|{sorted(params.items())}"
+    p = cache_path(f"fmp_openai_exposure_{hashlib.md5(key_src.encode('utf-8')).hexdigest()}")
+    cached = read_cache(p, max_age=max_age)
+    if cached is not None:
+        return cached
+    
+    resp = _session().get(
+        f"{FMP_BASE_URL}/{path}",
+        params={"apikey": settings.fmp_api_key, **params},
+        timeout=15,
+    )
+    if not resp.ok:
+        return None
+    data = resp.json()
+    if data:
+        write_cache(p, data)
+    return data
+
+
+def _fetch_profiles(settings: Settings, tickers: list[str]) -> dict[str, dict]:
+    """One /profile/{A,B,...} request for all `tickers`; symbol -> profile row."""
+    try:
+        data = _fmp_get_cached(
+            settings, f"profile/{','.join(tickers)}", max_age=PROFILE_CACHE_MAX_AGE
+        )
+        return {
+            row["symbol"]: row
+            for row in data or []
+            if isinstance(row, dict) and row.get("symbol")
+        }
+    except Exception:
+        return {}
+
+
+def fetch_company_exposure(
+    settings: Settings,
+    ticker: str,
+    profile: dict | None = None,
+) -> CompanyOpenAIExposure:
+    """
+    Fetch financial data and calculate OpenAI exposure for a company.
+    
+    `profile` is the ticker's FMP profile row when already fetched (e.g. batched by
+    `build_openai_exposure_report`); otherwise it is requested here.
+    """
     
     t = ticker.strip().upper()
     info = OPENAI_EXPOSURE.get(t, {})
@@ -321,34 +420,28 @@ def fetch_company_exposure(settings: Settings, ticker: str) -> CompanyOpenAIExpo
         downside_if_failure=info.get("downside_if_failure", ""),
     )
     
-    base_url = "https://financialmodelingprep.com/api/v3"
-    
     # Fetch market cap and financials
     try:
-        resp = requests.get(
-            f"{base_url}/profile/{t}",
-            params={"apikey": settings.fmp_api_key},
-            timeout=15,
-        )
-        if resp.ok:
-            data = resp.json()
+        if profile is None:
+            data = _fmp_get_cached(settings, f"profile/{t}", max_age=PROFILE_CACHE_MAX_AGE)
             if data:
-                exposure.market_cap = data[0].get("mktCap", 0) / 1e9
+                profile = data[0]
+        if profile:
+            exposure.market_cap = profile.get("mktCap", 0) / 1e9
     except Exception:
         pass
     
     try:
-        resp = requests.get(
-            f"{base_url}/income-statement/{t}",
-            params={"apikey": settings.fmp_api_key, "period": "annual", "limit": 1},
-            timeout=15,
+        data = _fmp_get_cached(
+            settings,
+            f"income-statement/{t}",
+            params={"period": "annual", "limit": 1},
+            max_age=INCOME_CACHE_MAX_AGE,
         )
-        if resp.ok:
-            data = resp.json()
-            if data:
-                exposure.revenue_ttm = data[0].get("revenue", 0) / 1e9
-                if data[0].get("revenue", 0) > 0:
-                    exposure.operating_margin = data[0].get("operatingIncome", 0) / data[0].get("revenue", 1)
+        if data:
+            exposure.revenue_ttm = data[0].get("revenue", 0) / 1e9
+            if data[0].get("revenue", 0) > 0:
+                exposure.operating_margin = data[0].get("operatingIncome", 0) / data[0].get("revenue", 1)
     except Exception:
         pass
     
@@ -412,21 +505,33 @@ def _calculate_exposure_risk(exposure: CompanyOpenAIExposure) -> int:
 def build_openai_exposure_report(settings: Settings) -> OpenAIExposureReport:
     """Build comprehensive OpenAI exposure report."""
     
-    report = OpenAIExposureReport(as_of=datetime.now().strftime("%Y-%m-%d"))
+    # One timestamp for the whole report (the health estimate shares it)
+    as_of = datetime.now().strftime("%Y-%m-%d")
+    report = OpenAIExposureReport(as_of=as_of)
     
     # Build OpenAI health estimate
-    report.openai_health = build_openai_health_estimate()
+    report.openai_health = build_openai_health_estimate(as_of=as_of)
+    
+    tickers = list(OPENAI_EXPOSURE.keys())
     
-    # Fetch exposure for all tracked companies
-    for ticker in OPENAI_EXPOSURE.keys():
-        try:
-            exp = fetch_company_exposure(settings, ticker)
-            report.exposed_companies.append(exp)
-        except Exception:
-            pass
+    # Profiles for every ticker come from one batched request
+    profiles = _fetch_profiles(settings, tickers)
+    
+    # Fetch exposure for all tracked companies concurrently (network-bound); results are
+    # collected in ticker order so the report matches the serial version
+    with ThreadPoolExecutor(max_workers=min(16, len(tickers))) as ex:
+        futures = [
+            ex.submit(fetch_company_exposure, settings, t, profiles.get(t)) for t in tickers
+        ]
+        for fut in futures:
+            try:
+                report.exposed_companies.append(fut.result())
+            except Exception:
+                pass
     
     # Sort by exposure risk
     report.exposed_companies.sort(key=lambda x: x.exposure_risk_score, reverse=True)
+    report.by_ticker = {e.ticker: e for e in report.exposed_companies}
     
     # Add disruption targets
     for ticker, info in OPENAI_DISRUPTION_RISK.items():
@@ -483,11 +588,13 @@ def _generate_thesis_implications(report: OpenAIExposureReport) -> list[str]:
     # If OpenAI fails/scales back
     implications.append("If OpenAI fails or significantly scales back:")
     
-    msft = next((e for e in report.exposed_companies if e.ticker == "MSFT"), None)
+    by_ticker = report.by_ticker or {e.ticker: e for e in report.exposed_companies}
+    
+    msft = by_ticker.get("MSFT")
     if msft:
         implications.append(f"  • MSFT: ${msft.investment_amount/1000:.0f}B write-off risk, Copilot strategy at risk")
     
-    nvda = next((e for e in report.exposed_companies if e.ticker == "NVDA"), None)
+    nvda = by_ticker.get("NVDA")
     if nvda:
         implications.append(f"  • NVDA: ~{nvda.openai_revenue_pct_est:.0f}% revenue loss, narrative hit on AI demand")
     
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Iterable
 
 from openai import OpenAI
 import requests
 
+from ai_options_trader.altdata.cache import cache_path, read_cache, write_cache
 from ai_options_trader.config import Settings
 
 
@@ -128,12 +131,16 @@ def fetch_fmp_stock_news(
     to_date: str,
     start_page: int = 0,
     max_pages: int = 3,
+    cache_max_age: timedelta = timedelta(hours=1),
 ) -> list[NewsItem]:
     """
     Fetch FMP `stock_news` for a list of tickers and return NewsItems.
 
     Example:
     `/api/v3/stock_news?tickers=AAPL,FB&page=0&from=2024-01-01&to=2024-03-01&apikey=...`
+
+    Each raw page is cached (altdata JSON cache) for `cache_max_age`, so repeated
+    `ticker news` / chat lookups for the same window skip the HTTP round-trips.
     """
     if not settings.fmp_api_key:
         raise RuntimeError("Missing FMP_API_KEY in environment / .env")
@@ -145,7 +152,7 @@ def fetch_fmp_stock_news(
     if not syms:
         return []
 
-    for page in range(int(start_page), int(start_page) + max(0, int(max_pages))):
+    def _fetch_page(page: int):
         params = {
             "tickers": ",".join(syms),
             "page": int(page),
@@ -153,9 +160,27 @@ def fetch_fmp_stock_news(
             "to": str(to_date),
             "apikey": settings.fmp_api_key,
         }
-        resp = requests.get(base_url, params=params, timeout=30)
-        resp.raise_for_status()
-        rows = resp.json()
+        key_src = f"{params['tickers']}|{params['page']}|{params['from']}|{params['to']}"
+        p = cache_path(f"fmp_stock_news_page_{hashlib.md5(key_src.encode('utf-8')).hexdigest()}")
+        rows = read_cache(p, max_age=cache_max_age)
+        if not isinstance(rows, list):
+            resp = requests.get(base_url, params=params, timeout=30)
+            resp.raise_for_status()
+            rows = resp.json()
+            if isinstance(rows, list):
+                write_cache(p, rows)
+        return rows
+
+    pages = range(int(start_page), int(start_page) + max(0, int(max_pages)))
+    if not pages:
+        return []
+    # Pages are independent URLs: request them concurrently (I/O bound), then consume in page
+    # order so the "stop at the first empty page" semantics (and which error surfaces) are kept.
+    with ThreadPoolExecutor(max_workers=min(5, len(pages))) as ex:
+        page_rows = [ex.submit(_fetch_page, page) for page in pages]
+
+    for fut in page_rows:
+        rows = fut.result()
         # Response shape: list[ {symbol, publishedDate, title, site, text, url, ...}, ... ]
         if not isinstance(rows, list) or not rows:
             break
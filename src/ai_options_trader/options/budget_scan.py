@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from typing import Iterable, Literal, Sequence
+from typing import Iterable, Iterator, Literal, Sequence
+
+import numpy as np
 
 from ai_options_trader.data.alpaca import OptionCandidate
 from ai_options_trader.utils.occ import parse_occ_option_symbol
@@ -38,7 +40,7 @@ def _spread_pct(bid: float | None, ask: float | None, mid: float | None) -> floa
     return float((ask - bid) / mid)
 
 
-def affordable_options_for_ticker(
+def iter_affordable_options(
     candidates: Iterable[OptionCandidate],
     *,
     ticker: str,
@@ -55,14 +57,15 @@ def affordable_options_for_ticker(
     min_volume: int = 10,  # Lowered for illiquid underlyings
     require_liquidity: bool = True,
     today: date | None = None,
-) -> Sequence[AffordableOption]:
+) -> Iterator[AffordableOption]:
     """
-    Return all option contracts within DTE window whose premium is <= max_premium_usd.
+    Stream option contracts within DTE window whose premium is <= max_premium_usd.
 
+    Single pass over `candidates` (which may be a lazy `to_candidates(...)` generator);
+    only survivors of the DTE / price / spread / delta / liquidity filters are yielded.
     Premium is computed as `price * 100` where `price` is chosen based on `price_basis`.
     """
     today = today or date.today()
-    out: list[AffordableOption] = []
 
     for c in candidates:
         try:
@@ -117,28 +120,66 @@ def affordable_options_for_ticker(
             if not (oi_ok or vol_ok):
                 continue
 
-        out.append(
-            AffordableOption(
-                ticker=ticker,
-                symbol=c.symbol,
-                opt_type=opt_type,
-                expiry=expiry,
-                dte_days=int(dte),
-                strike=float(strike),
-                price=px,
-                premium_usd=prem,
-                spread_pct=sp,
-                delta=float(c.delta) if c.delta is not None else None,
-                gamma=float(c.gamma) if c.gamma is not None else None,
-                theta=float(c.theta) if c.theta is not None else None,
-                vega=float(c.vega) if c.vega is not None else None,
-                iv=float(c.iv) if c.iv is not None else None,
-                oi=int(c.oi) if c.oi is not None else None,
-                volume=int(c.volume) if c.volume is not None else None,
-            )
+        yield AffordableOption(
+            ticker=ticker,
+            symbol=c.symbol,
+            opt_type=opt_type,
+            expiry=expiry,
+            dte_days=int(dte),
+            strike=float(strike),
+            price=px,
+            premium_usd=prem,
+            spread_pct=sp,
+            delta=float(c.delta) if c.delta is not None else None,
+            gamma=float(c.gamma) if c.gamma is not None else None,
+            theta=float(c.theta) if c.theta is not None else None,
+            vega=float(c.vega) if c.vega is not None else None,
+            iv=float(c.iv) if c.iv is not None else None,
+            oi=int(c.oi) if c.oi is not None else None,
+            volume=int(c.volume) if c.volume is not None else None,
         )
 
-    return out
+
+def affordable_options_for_ticker(
+    candidates: Iterable[OptionCandidate],
+    *,
+    ticker: str,
+    max_premium_usd: float = 100.0,
+    min_dte_days: int = 7,
+    max_dte_days: int = 45,
+    want: Want = "both",
+    price_basis: PriceBasis = "ask",
+    min_price: float = 0.05,
+    require_delta: bool = True,
+    max_spread_pct: float = 0.30,
+    min_open_interest: int = 10,
+    min_volume: int = 10,
+    require_liquidity: bool = True,
+    today: date | None = None,
+) -> Sequence[AffordableOption]:
+    """
+    Return all option contracts within DTE window whose premium is <= max_premium_usd.
+
+    Materialized form of `iter_affordable_options` (same filters).
+    """
+    return list(
+        iter_affordable_options(
+            candidates,
+            ticker=ticker,
+            max_premium_usd=max_premium_usd,
+            min_dte_days=min_dte_days,
+            max_dte_days=max_dte_days,
+            want=want,
+            price_basis=price_basis,
+            min_price=min_price,
+            require_delta=require_delta,
+            max_spread_pct=max_spread_pct,
+            min_open_interest=min_open_interest,
+            min_volume=min_volume,
+            require_liquidity=require_liquidity,
+            today=today,
+        )
+    )
 
 
 def pick_best_affordable(
@@ -158,14 +199,39 @@ def pick_best_affordable(
     if not opts:
         return None
 
-    def _key(o: AffordableOption) -> tuple[int, float, float, float]:
-        sp_ok = 1 if (o.spread_pct is not None and o.spread_pct <= float(max_spread_pct)) else 0
-        has_delta = 1 if o.delta is not None else 0
-        delta_dist = abs(abs(o.delta) - float(target_abs_delta)) if o.delta is not None else 1e9
-        spread = float(o.spread_pct) if o.spread_pct is not None else 1e9
-        return (-sp_ok, -has_delta, delta_dist, o.premium_usd + 10.0 * spread)
-
-    return sorted(opts, key=_key)[0]
+    n = len(opts)
+    deltas = np.fromiter((o.delta if o.delta is not None else np.nan for o in opts), dtype=np.float64, count=n)
+    spreads = np.fromiter(
+        (o.spread_pct if o.spread_pct is not None else np.nan for o in opts), dtype=np.float64, count=n
+    )
+    premiums = np.fromiter((o.premium_usd for o in opts), dtype=np.float64, count=n)
+    i = _pick_best_affordable_idx(
+        deltas, premiums, spreads,
+        target_abs_delta=float(target_abs_delta), max_spread_pct=float(max_spread_pct),
+    )
+    return opts[i]
+
+
+def _pick_best_affordable_idx(
+    deltas: np.ndarray,
+    premiums: np.ndarray,
+    spreads: np.ndarray,
+    *,
+    target_abs_delta: float,
+    max_spread_pct: float,
+) -> int:
+    """
+    Index of the best row under the `pick_best_affordable` ordering, over parallel arrays
+    (NaN = missing). Stable like `sorted(...)[0]`: ties resolve to the earliest row.
+    """
+    has_spread = ~np.isnan(spreads)
+    has_delta = ~np.isnan(deltas)
+    sp_ok = has_spread & (np.where(has_spread, spreads, np.inf) <= max_spread_pct)
+    delta_dist = np.where(has_delta, np.abs(np.abs(deltas) - target_abs_delta), 1e9)
+    cost = premiums + 10.0 * np.where(has_spread, spreads, 1e9)
+    # lexsort: last key is primary.
+    order = np.lexsort((cost, delta_dist, ~has_delta, ~sp_ok))
+    return int(order[0])
 
 
 def score_delta_theta(
@@ -27,6 +27,45 @@ class MoonshotStats:
     extreme_return: float | None
 
 
+def _welford_std_cols(arr: np.ndarray, ddof: int = 1) -> np.ndarray:
+    """
+    Column-wise sample std in a single pass (Welford), skipping NaNs per column.
+
+    Loops over rows (the window is short) while updating every column at once, so there is
+    no separate mean pass and no sum-of-squares cancellation. Columns with <= ddof finite
+    values come back as NaN.
+    """
+    n_cols = arr.shape[1]
+    count = np.zeros(n_cols, dtype=np.float64)
+    mean = np.zeros(n_cols, dtype=np.float64)
+    m2 = np.zeros(n_cols, dtype=np.float64)
+    for row in arr:
+        ok = np.isfinite(row)
+        count += ok
+        delta = np.where(ok, row - mean, 0.0)
+        mean += np.divide(delta, count, out=np.zeros(n_cols), where=ok)
+        m2 += np.where(ok, delta * (row - mean), 0.0)
+    out = np.full(n_cols, np.nan)
+    enough = count > ddof
+    out[enough] = np.sqrt(m2[enough] / (count[enough] - ddof))
+    return out
+
+
+def realized_vol_ann(px: pd.DataFrame, *, asof: pd.Timestamp, lookback_days: int) -> pd.Series | None:
+    """
+    Annualized realized vol of daily log returns over the `lookback_days` window ending at `asof`.
+
+    Returns one value per column of `px` (NaN when there is too little history), or None when the
+    window is too short to estimate anything.
+    """
+    tail = px.loc[:asof].tail(int(lookback_days) + 1).to_numpy(dtype=np.float64)
+    if tail.shape[0] < 3:
+        return None
+    with np.errstate(divide="ignore", invalid="ignore"):
+        logret = np.diff(np.log(tail), axis=0)
+    return pd.Series(_welford_std_cols(logret, ddof=1) * np.sqrt(252.0), index=px.columns)
+
+
 def _to_float_df(x: pd.DataFrame) -> pd.DataFrame:
     y = x.copy()
     for c in y.columns:
@@ -0,0 +1,119 @@
+"""
+Shared regime-state bundle for the `regimes` / `regime-features` commands.
+
+Both commands need the same FRED-backed `build_*_state` outputs. Building them through one
+factory means:
+- the independent, network-bound builders run concurrently
+- every state goes through `regimes.state_cache`, so chaining the commands in one session
+  (or re-running within the TTL) does not repeat the downloads
+"""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from ai_options_trader.regimes.state_cache import cached_state
+
+ALL_DOMAINS: tuple[str, ...] = ("macro", "funding", "usd", "rates", "volatility", "commodities")
+
+
+@dataclass(frozen=True)
+class StatesBundle:
+    """
+    Regime states by domain, each paired with its classified regime where the domain has a
+    classifier (None for domains that were not requested / have no classifier).
+    """
+
+    macro: Any = None
+    macro_regime: Any = None
+    funding: Any = None
+    usd: Any = None
+    rates: Any = None
+    rates_regime: Any = None
+    volatility: Any = None
+    volatility_regime: Any = None
+    commodities: Any = None
+    commodities_regime: Any = None
+
+
+def _classify_macro(state: Any) -> Any:
+    from ai_options_trader.macro.regime import classify_macro_regime_from_state
+
+    inp = state.inputs
+    return classify_macro_regime_from_state(
+        cpi_yoy=inp.cpi_yoy,
+        payrolls_3m_annualized=inp.payrolls_3m_annualized,
+        inflation_momentum_minus_be5y=inp.inflation_momentum_minus_be5y,
+        real_yield_proxy_10y=inp.real_yield_proxy_10y,
+        z_inflation_momentum_minus_be5y=inp.components.get("z_infl_mom_minus_be5y") if inp.components else None,
+        z_real_yield_proxy_10y=inp.components.get("z_real_yield_proxy_10y") if inp.components else None,
+        use_zscores=True,
+        cpi_target=3.0,
+        infl_thresh=0.0,
+        real_thresh=0.0,
+    )
+
+
+def _builders() -> dict[str, tuple[Callable[..., Any], Callable[[Any], Any] | None]]:
+    """domain -> (state builder, classifier or None)."""
+    from ai_options_trader.commodities.regime import classify_commodities_regime
+    from ai_options_trader.commodities.signals import build_commodities_state
+    from ai_options_trader.funding.signals import build_funding_state
+    from ai_options_trader.macro.signals import build_macro_state
+    from ai_options_trader.rates.regime import classify_rates_regime
+    from ai_options_trader.rates.signals import build_rates_state
+    from ai_options_trader.usd.signals import build_usd_state
+    from ai_options_trader.volatility.regime import classify_volatility_regime
+    from ai_options_trader.volatility.signals import build_volatility_state
+
+    return {
+        "macro": (build_macro_state, _classify_macro),
+        "funding": (build_funding_state, None),
+        "usd": (build_usd_state, None),
+        "rates": (build_rates_state, lambda st: classify_rates_regime(st.inputs)),
+        "volatility": (build_volatility_state, lambda st: classify_volatility_regime(st.inputs)),
+        "commodities": (build_commodities_state, lambda st: classify_commodities_regime(st.inputs)),
+    }
+
+
+def _classified(builder: Callable[..., Any], classify: Callable[[Any], Any] | None) -> Callable[..., Any]:
+    """Adapt a state builder to return (state, regime) so both are cached as one entry."""
+
+    def _build(*, settings: Any, start_date: str, refresh: bool) -> tuple[Any, Any]:
+        state = builder(settings=settings, start_date=start_date, refresh=refresh)
+        return state, (classify(state) if classify is not None else None)
+
+    return _build
+
+
+def build_bundle(
+    settings: Any,
+    *,
+    start_date: str,
+    refresh: bool = False,
+    domains: tuple[str, ...] = ALL_DOMAINS,
+) -> StatesBundle:
+    """Build (or load from cache) the requested regime states + regimes concurrently."""
+    unknown = [d for d in domains if d not in ALL_DOMAINS]
+    if unknown:
+        raise ValueError(f"Unknown regime domain(s): {unknown}. Choose from: {list(ALL_DOMAINS)}")
+    if not domains:
+        return StatesBundle()
+
+    builders = _builders()
+    with ThreadPoolExecutor(max_workers=len(domains)) as ex:
+        futs = {
+            d: ex.submit(
+                cached_state, f"{d}+regime", _classified(*builders[d]),
+                settings=settings, start_date=start_date, refresh=refresh,
+            )
+            for d in domains
+        }
+        fields: dict[str, Any] = {}
+        for d, f in futs.items():
+            state, regime = f.result()
+            fields[d] = state
+            if builders[d][1] is not None:
+                fields[f"{d}_regime"] = regime
+        return StatesBundle(**fields)
@@ -0,0 +1,108 @@
+"""
+TTL'd cache around the `build_*_state(settings=..., start_date=..., refresh=...)` regime builders.
+
+Regime states are cached twice:
+- in-process (so `regimes` then `regime-features` in one session rebuilds nothing)
+- on disk under `$AOT_CACHE_DIR/regime_states/{name}-{key}.pkl`
+  (so back-to-back CLI invocations skip the FRED / market-data round-trips)
+
+Entries are keyed by (builder name, start date, settings fingerprint) and expire after `ttl`.
+`refresh=True` always re-runs the builder (which forwards `refresh` to its own downloads)
+and re-populates both layers.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+DEFAULT_STATE_TTL = timedelta(hours=6)
+
+_MEMO: dict[tuple[str, str, str], tuple[float, Any]] = {}
+_LOCK = threading.Lock()
+
+
+def settings_fingerprint(settings: Any) -> str:
+    """Stable short hash of the settings that feed a builder (keys, feeds, price source)."""
+    try:
+        payload = settings.model_dump_json()
+    except AttributeError:
+        payload = repr(settings)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _cache_path(name: str, start_date: str, fingerprint: str) -> Path:
+    root = Path(os.environ.get("AOT_CACHE_DIR", "data/cache"))
+    key = hashlib.sha1(f"{start_date}|{fingerprint}".encode("utf-8")).hexdigest()[:16]
+    return root / "regime_states" / f"{name}-{key}.pkl"
+
+
+def _read_disk(path: Path, *, max_age_s: float) -> tuple[float, Any] | None:
+    try:
+        if not path.exists():
+            return None
+        mtime = path.stat().st_mtime
+        if time.time() - mtime > max_age_s:
+            return None
+        with path.open("rb") as f:
+            return mtime, pickle.load(f)
+    except Exception:
+        return None
+
+
+def _write_disk(path: Path, value: Any) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        # Cache writes are best-effort (e.g. unpicklable payloads, read-only FS).
+        pass
+
+
+def cached_state(
+    name: str,
+    builder: Callable[..., Any],
+    *,
+    settings: Any,
+    start_date: str,
+    refresh: bool = False,
+    ttl: timedelta = DEFAULT_STATE_TTL,
+) -> Any:
+    """
+    Same contract as `builder(settings=..., start_date=..., refresh=...)`, served from cache
+    when a fresh entry exists for `name`.
+    """
+    fp = settings_fingerprint(settings)
+    key = (name, str(start_date), fp)
+    max_age_s = ttl.total_seconds()
+
+    if not refresh:
+        with _LOCK:
+            hit = _MEMO.get(key)
+        if hit is not None and time.time() - hit[0] <= max_age_s:
+            return hit[1]
+
+    path = _cache_path(name, str(start_date), fp)
+    entry = None if refresh else _read_disk(path, max_age_s=max_age_s)
+    if entry is None:
+        value = builder(settings=settings, start_date=start_date, refresh=refresh)
+        _write_disk(path, value)
+        entry = (time.time(), value)
+
+    with _LOCK:
+        _MEMO[key] = entry
+    return entry[1]
+
+
+def clear_state_memo() -> None:
+    """Drop the in-process layer (the on-disk layer expires on its own)."""
+    with _LOCK:
+        _MEMO.clear()
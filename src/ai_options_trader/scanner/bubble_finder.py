@@ -4,6 +4,7 @@ Bubble Finder - Scans for extreme moves and analyzes reversion potential.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from typing import Optional, Literal
@@ -158,6 +159,7 @@ def scan_for_bubbles(
     include_news: bool = True,
     include_earnings: bool = True,
     top_n: int = 20,
+    workers: int = 8,
 ) -> BubbleScanResult:
     """
     Scan a universe of stocks for bubble/crash candidates.
@@ -171,6 +173,7 @@ def scan_for_bubbles(
         include_news: Fetch recent news for context
         include_earnings: Check for recent earnings
         top_n: Return top N bubbles and crashes
+        workers: Max concurrent price-batch downloads (network bound)
     
     Returns:
         BubbleScanResult with bubble and crash candidates
@@ -184,16 +187,27 @@ def scan_for_bubbles(
     
     prices = None
     batch_size = 50
-    
-    for i in range(0, len(tickers), batch_size):
-        batch = tickers[i:i + batch_size]
+    batches = [tickers[i:i + batch_size] for i in range(0, len(tickers), batch_size)]
+
+    def _fetch_batch(batch: list[str]) -> pd.DataFrame | None:
         try:
-            batch_prices = fetch_equity_daily_closes(
+            return fetch_equity_daily_closes(
                 settings=settings,
                 symbols=batch,
                 start=start_date,
                 refresh=True,
             )
+        except Exception:
+            # Skip failed batches
+            return None
+
+    # Batches are independent downloads: fetch them concurrently, then merge in batch order
+    # so duplicate columns resolve exactly as in a serial scan (first batch wins).
+    with ThreadPoolExecutor(max_workers=max(1, min(int(workers), len(batches)))) as ex:
+        batch_results = list(ex.map(_fetch_batch, batches))
+
+    for batch_prices in batch_results:
+        try:
             if batch_prices is not None and not batch_prices.empty:
                 if prices is None:
                     prices = batch_prices
@@ -203,7 +217,7 @@ def scan_for_bubbles(
                     # Remove duplicate columns
                     prices = prices.loc[:, ~prices.columns.str.endswith("_dup")]
         except Exception:
-            # Skip failed batches
+            # Skip batches that fail to merge
             continue
     
     if prices is None or prices.empty:
@@ -23,3 +23,8 @@ BASKETS: Dict[str, Basket] = {
         description="Large retailers with significant imported goods exposure.",
     ),
 }
+
+# Basket names and the union of every basket's tickers (the `--baskets all` selection),
+# computed once at import.
+ALL_BASKET_NAMES: tuple[str, ...] = tuple(BASKETS.keys())
+ALL_UNIVERSE: tuple[str, ...] = tuple(sorted(frozenset().union(*(b.tickers for b in BASKETS.values()))))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 import csv
 from typing import Any
@@ -12,6 +13,15 @@ class Sp500Universe:
     skipped: list[str]
     source: str
 
+    @cached_property
+    def ticker_set(self) -> frozenset[str]:
+        """Upper-cased membership set (built once per universe object)."""
+        return frozenset(t.strip().upper() for t in self.tickers)
+
+
+# Parsed universes keyed by (cache file, mtime, skip_dotted); the CSV only changes on refresh.
+_PARSED: dict[tuple[str, int, bool], Sp500Universe] = {}
+
 
 DEFAULT_SP500_CSV_URL = "https://datahub.io/core/s-and-p-500-companies/r/constituents.csv"
 DEFAULT_SP500_FMP_URL = "https://financialmodelingprep.com/api/v3/sp500_constituent"
@@ -92,6 +102,11 @@ def load_sp500_universe(
                     "Set `FMP_API_KEY=...` in your `.env`, or pass a working `url=` to `load_sp500_universe`."
                 )
 
+    memo_key = (str(p.resolve()), p.stat().st_mtime_ns, bool(skip_dotted))
+    hit = _PARSED.get(memo_key)
+    if hit is not None:
+        return hit
+
     rows: list[dict[str, str]] = []
     with p.open("r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
@@ -118,6 +133,8 @@ def load_sp500_universe(
         seen.add(t)
         uniq.append(t)
 
-    return Sp500Universe(tickers=uniq, skipped=skipped, source=str(p))
+    uni = Sp500Universe(tickers=uniq, skipped=skipped, source=str(p))
+    _PARSED[memo_key] = uni
+    return uni
 
 
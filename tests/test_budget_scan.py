@@ -3,7 +3,11 @@ from __future__ import annotations
 from datetime import date
 
 from ai_options_trader.data.alpaca import OptionCandidate
-from ai_options_trader.options.budget_scan import affordable_options_for_ticker, pick_best_affordable
+from ai_options_trader.options.budget_scan import (
+    affordable_options_for_ticker,
+    iter_affordable_options,
+    pick_best_affordable,
+)
 
 
 def _c(
@@ -82,3 +86,25 @@ def test_pick_best_affordable_prefers_spread_ok_and_delta_near_target():
     assert best.symbol == a.symbol
 
 
+def test_iter_affordable_options_streams_a_generator_once():
+    today = date(2026, 1, 7)
+    a = _c("SPY260117C00600000", bid=0.79, ask=0.80, delta=0.30)
+    b = _c("SPY260117C00605000", bid=1.10, ask=1.20, delta=0.30)
+    seen: list[str] = []
+
+    def _gen():
+        for c in (a, b):
+            seen.append(c.symbol)
+            yield c
+
+    it = iter_affordable_options(
+        _gen(),
+        ticker="SPY",
+        max_premium_usd=100.0,
+        min_dte_days=7,
+        max_dte_days=30,
+        today=today,
+    )
+    assert seen == []  # lazy until consumed
+    assert [o.symbol for o in it] == [a.symbol]
+    assert seen == [a.symbol, b.symbol]
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from ai_options_trader.cli_commands.shared.symbols import split_symbols
+
+
+def test_split_symbols_accepts_commas_and_whitespace():
+    assert split_symbols(" aapl, msft  NVDA,,tsm ") == ["AAPL", "MSFT", "NVDA", "TSM"]
+    assert split_symbols("growth, Value", upper=False) == ["growth", "Value"]
+    assert split_symbols(None) == []
+    assert split_symbols("  ") == []
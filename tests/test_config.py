@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from ai_options_trader import config
+
+
+def test_load_settings_is_memoized_until_cache_clear(monkeypatch):
+    monkeypatch.chdir("/")  # keep a local .env out of the picture
+    monkeypatch.setenv("ALPACA_API_KEY", "k1")
+    monkeypatch.setenv("ALPACA_API_SECRET", "s1")
+    config.load_settings.cache_clear()
+    try:
+        a = config.load_settings()
+        assert config.load_settings() is a
+
+        monkeypatch.setenv("ALPACA_API_KEY", "k2")
+        assert config.load_settings().ALPACA_API_KEY == "k1"
+
+        config.load_settings.cache_clear()
+        assert config.load_settings().ALPACA_API_KEY == "k2"
+    finally:
+        config.load_settings.cache_clear()
+
+
+def test_settings_are_frozen(monkeypatch):
+    monkeypatch.setenv("ALPACA_API_KEY", "k")
+    monkeypatch.setenv("ALPACA_API_SECRET", "s")
+    s = config.Settings(_env_file=None)
+    with pytest.raises(ValidationError):
+        s.FRED_API_KEY = "x"
+    assert hash(s) == hash(config.Settings(_env_file=None))
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from itertools import islice
+from types import SimpleNamespace
+
+import pytest
+
+from ai_options_trader.fundamentals import nvda_ecosystem as eco
+
+
+class _Resp:
+    ok = True
+
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+
+
+class _Status:
+    ok = False
+
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+def _quotes(syms: list[str], **fields) -> _Resp:
+    return _Resp([{"symbol": s, "price": 1.0, **fields} for s in syms])
+
+
+@pytest.fixture
+def fmp(monkeypatch):
+    """Fake FMP quote endpoint: records requested symbols per call; `respond(syms)` builds the response."""
+    fake = SimpleNamespace(calls=[], respond=_quotes, settings=SimpleNamespace(fmp_api_key="k"))
+
+    def _get(url, params=None, timeout=None):
+        syms = url.rsplit("/", 1)[-1].split(",")
+        fake.calls.append(syms)
+        return fake.respond(syms)
+
+    monkeypatch.setattr(eco, "_session", lambda: SimpleNamespace(get=_get))
+    eco.clear_quote_memo()
+    return fake
+
+
+def test_build_ecosystem_report_batches_quotes(fmp):
+    fmp.respond = lambda syms: _quotes(syms, price=10.0, marketCap=2e9, changesPercentage=1.5)
+    report = eco.build_ecosystem_report(fmp.settings, "all")
+
+    n = len(eco.get_basket_tickers("all")) + 1  # + NVDA
+    assert len(fmp.calls) == -(-n // eco._QUOTE_BATCH)
+    assert fmp.calls[0][0] == "NVDA"
+    assert report.nvda_price == 10.0
+    assert all(t.price == 10.0 and t.market_cap == 2.0 for t in report.tickers)
+    assert report.avg_return_1d == 1.5
+
+
+def test_fetch_quotes_falls_back_per_symbol_when_batch_fails(fmp):
+    fmp.respond = lambda syms: _Status(414) if len(syms) > 1 else _quotes(syms)
+    quotes = eco._fetch_quotes(fmp.settings, ["NVDA", "MSFT", "TSM"])
+    assert sorted(quotes) == ["MSFT", "NVDA", "TSM"]
+
+
+def test_fetch_quotes_does_not_fan_out_on_rate_limit(fmp):
+    fmp.respond = lambda syms: _Status(429)
+    quotes = eco._fetch_quotes(fmp.settings, ["NVDA", "MSFT", "TSM"])
+    assert quotes == {}
+    assert len(fmp.calls) == 1
+
+
+def test_lookup_helpers_are_memoized():
+    assert eco.get_basket_tickers("nope") == eco.get_basket_tickers("all")
+    assert isinstance(eco.get_basket_tickers("customers"), tuple)
+    assert eco.get_ecosystem_summary() is eco.get_ecosystem_summary()
+    assert eco.get_ticker_info("msft") is eco.get_ticker_info("msft")
+
+
+def test_get_baskets_for_ticker_matches_basket_definitions():
+    for name, b in eco.NVDA_BASKETS.items():
+        for t in b["tickers"]:
+            assert name in eco.get_baskets_for_ticker(t.lower())
+    assert eco.get_baskets_for_ticker("ZZZZ") == frozenset()
+
+
+def test_fetch_quotes_serves_recent_symbols_from_memo(fmp):
+    eco._fetch_quotes(fmp.settings, ["NVDA", "MSFT"])
+    quotes = eco._fetch_quotes(fmp.settings, ["NVDA", "MSFT", "TSM"])
+    assert sorted(quotes) == ["MSFT", "NVDA", "TSM"]
+    assert fmp.calls == [["NVDA", "MSFT"], ["TSM"]]
+
+
+def test_iter_basket_matches_get_basket_tickers():
+    assert list(islice(eco.iter_basket("all"), 2)) == list(eco.NVDA_ECOSYSTEM)[:2]
+    assert tuple(eco.iter_basket("critical")) == eco.get_basket_tickers("critical")
+    assert tuple(eco.iter_basket("nope")) == eco.get_basket_tickers("all")
+
+
+def test_build_ecosystem_report_async_matches_sync(fmp):
+    fmp.respond = lambda syms: _quotes(syms, price=3.0, changesPercentage=0.5)
+    report = asyncio.run(eco.build_ecosystem_report_async(fmp.settings, "customers"))
+    assert report == eco.build_ecosystem_report(fmp.settings, "customers")
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+from ai_options_trader.fundamentals import openai_exposure as oe
+
+
+def test_build_openai_exposure_report_fetches_all_tickers_concurrently(monkeypatch):
+    seen: list[str] = []
+    lock = threading.Lock()
+
+    def _fake_fetch(settings, ticker, profile=None):
+        with lock:
+            seen.append(ticker)
+        if ticker == "ARM":
+            raise RuntimeError("boom")
+        return oe.CompanyOpenAIExposure(ticker=ticker, name=ticker, relationship="x")
+
+    monkeypatch.setattr(oe, "fetch_company_exposure", _fake_fetch)
+    monkeypatch.setattr(oe, "_fetch_profiles", lambda settings, tickers: {})
+    report = oe.build_openai_exposure_report(SimpleNamespace(fmp_api_key="k"))
+
+    assert sorted(seen) == sorted(oe.OPENAI_EXPOSURE)
+    assert report.openai_health.as_of == report.as_of
+    assert [e.ticker for e in report.exposed_companies] == [
+        t for t in oe.OPENAI_EXPOSURE if t != "ARM"
+    ]
+
+
+class _Resp:
+    ok = True
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+def test_profiles_are_batched_and_income_statements_per_ticker(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOT_CACHE_DIR", str(tmp_path))
+    urls: list[str] = []
+    lock = threading.Lock()
+
+    def _fake_get(url, params=None, timeout=None):
+        with lock:
+            urls.append(url)
+        syms = url.rsplit("/", 1)[-1].split(",")
+        if "/profile/" in url:
+            return _Resp([{"symbol": s, "mktCap": 1e12} for s in syms])
+        return _Resp([{"revenue": 2e9, "operatingIncome": 5e8}])
+
+    monkeypatch.setattr(oe, "_session", lambda: SimpleNamespace(get=_fake_get))
+    report = oe.build_openai_exposure_report(SimpleNamespace(fmp_api_key="k"))
+
+    profile_calls = [u for u in urls if "/profile/" in u]
+    assert len(profile_calls) == 1
+    assert len(urls) == 1 + len(oe.OPENAI_EXPOSURE)
+    assert all(e.market_cap == 1000.0 and e.revenue_ttm == 2.0 for e in report.exposed_companies)
+
+    # Second build is served entirely from the on-disk cache.
+    urls.clear()
+    again = oe.build_openai_exposure_report(SimpleNamespace(fmp_api_key="k"))
+    assert urls == []
+    assert [e.market_cap for e in again.exposed_companies] == [
+        e.market_cap for e in report.exposed_companies
+    ]
+
+
+def test_thesis_implications_use_ticker_index():
+    msft = oe.CompanyOpenAIExposure(
+        ticker="MSFT", name="Microsoft", relationship="x", investment_amount=13_000
+    )
+    report = oe.OpenAIExposureReport(
+        as_of="2026-01-02",
+        openai_health=oe.build_openai_health_estimate(),
+        exposed_companies=[msft],
+    )
+    lines = oe._generate_thesis_implications(report)
+    assert any(line.startswith("  • MSFT: $13B") for line in lines)
+    assert not any(line.startswith("  • NVDA: ~") for line in lines)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from datetime import date
+
+from ai_options_trader.data import option_chain_cache as occ_cache
+
+
+def test_cached_fetch_option_chain_hits_memo_then_disk(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOT_CACHE_DIR", str(tmp_path))
+    occ_cache.clear_option_chain_memo()
+
+    calls: list[str] = []
+
+    def _fake_fetch(data_client, ticker, *, feed=None):
+        calls.append(ticker)
+        return {f"{ticker}260117C00100000": {"bid": 1.0}}
+
+    monkeypatch.setattr(occ_cache, "fetch_option_chain", _fake_fetch)
+    asof = date(2026, 1, 7)
+
+    a = occ_cache.cached_fetch_option_chain(None, "spy", feed="opra", asof=asof)
+    b = occ_cache.cached_fetch_option_chain(None, "SPY", feed="opra", asof=asof)
+    assert a == b
+    assert calls == ["SPY"]
+    assert (tmp_path / "option_chains" / "2026-01-07" / "SPY_opra.pkl").exists()
+
+    # New process (empty memo) should be served from disk.
+    occ_cache.clear_option_chain_memo()
+    c = occ_cache.cached_fetch_option_chain(None, "SPY", feed="opra", asof=asof)
+    assert c == a
+    assert calls == ["SPY"]
+
+    # Explicit refresh always goes to the network.
+    occ_cache.cached_fetch_option_chain(None, "SPY", feed="opra", asof=asof, refresh=True)
+    assert calls == ["SPY", "SPY"]
@@ -3,7 +3,11 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
-from ai_options_trader.options.moonshot import rank_moonshots, rank_moonshots_unconditional
+from ai_options_trader.options.moonshot import (
+    rank_moonshots,
+    rank_moonshots_unconditional,
+    realized_vol_ann,
+)
 
 
 def test_rank_moonshots_prefers_true_extreme_in_analogs():
@@ -52,3 +56,27 @@ def test_rank_moonshots_unconditional_returns_candidates():
     ranked = rank_moonshots_unconditional(px=px, asof=idx[-5], horizon_days=21, min_samples=100, direction="both")
     assert ranked
 
+
+def test_realized_vol_ann_matches_two_pass_std_on_large_prices():
+    idx = pd.date_range("2024-01-01", periods=60, freq="D")
+    rng = np.random.default_rng(1)
+    # Large-magnitude levels are where naive sum-of-squares variance loses precision.
+    px = pd.DataFrame(
+        {
+            "BIG": 1e6 * np.exp(np.cumsum(rng.normal(0, 0.01, len(idx)))),
+            "GAP": 100.0 * np.exp(np.cumsum(rng.normal(0, 0.02, len(idx)))),
+            "NEW": np.nan,
+        },
+        index=idx,
+    )
+    px.loc[idx[-5], "GAP"] = np.nan
+
+    rv = realized_vol_ann(px, asof=idx[-1], lookback_days=14)
+    assert rv is not None
+
+    logret = np.diff(np.log(px.tail(15).to_numpy()), axis=0)
+    expected_big = np.std(logret[:, 0], ddof=1) * np.sqrt(252.0)
+    expected_gap = np.nanstd(logret[:, 1], ddof=1) * np.sqrt(252.0)
+    assert abs(rv["BIG"] - expected_big) < 1e-12
+    assert abs(rv["GAP"] - expected_gap) < 1e-12
+    assert np.isnan(rv["NEW"])
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from ai_options_trader.data import price_cache
+
+
+def test_cached_equity_daily_closes_only_fetches_missing_symbols(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOT_CACHE_DIR", str(tmp_path))
+    idx = pd.bdate_range("2024-01-01", periods=5)
+    requested: list[list[str]] = []
+
+    def _fetch(*, settings, symbols, start, refresh):
+        requested.append(list(symbols))
+        return pd.DataFrame({s: range(1, 6) for s in symbols}, index=idx, dtype=float)
+
+    a = price_cache.cached_equity_daily_closes(settings=None, symbols=["xly", "AAPL"], start="2024-01-01", fetcher=_fetch)
+    assert list(a.columns) == ["XLY", "AAPL"]
+    assert requested == [["XLY", "AAPL"]]
+
+    # Overlapping request: only the new symbol goes to the fetcher; cached columns round-trip.
+    b = price_cache.cached_equity_daily_closes(settings=None, symbols=["AAPL", "NKE"], start="2024-01-01", fetcher=_fetch)
+    assert requested[-1] == ["NKE"]
+    assert list(b.columns) == ["AAPL", "NKE"]
+    pd.testing.assert_series_equal(b["AAPL"], a["AAPL"], check_freq=False, check_names=False)
+
+    # refresh bypasses the cache for every symbol.
+    price_cache.cached_equity_daily_closes(
+        settings=None, symbols=["AAPL", "NKE"], start="2024-01-01", refresh=True, fetcher=_fetch,
+    )
+    assert requested[-1] == ["AAPL", "NKE"]
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from ai_options_trader.regimes import state_cache
+
+
+class _Settings:
+    def __init__(self, key: str):
+        self.key = key
+
+    def model_dump_json(self) -> str:
+        return f'{{"FRED_API_KEY": "{self.key}"}}'
+
+
+def test_cached_state_hits_memo_then_disk_and_respects_refresh(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOT_CACHE_DIR", str(tmp_path))
+    state_cache.clear_state_memo()
+
+    calls: list[tuple[str, bool]] = []
+
+    def _build(*, settings, start_date, refresh):
+        calls.append((start_date, refresh))
+        return {"asof": "2026-01-02", "start": start_date}
+
+    s = _Settings("k1")
+    a = state_cache.cached_state("macro", _build, settings=s, start_date="2011-01-01")
+    b = state_cache.cached_state("macro", _build, settings=s, start_date="2011-01-01")
+    assert a == b
+    assert calls == [("2011-01-01", False)]
+    assert list((tmp_path / "regime_states").glob("macro-*.pkl"))
+
+    # New process (empty memo) should be served from disk.
+    state_cache.clear_state_memo()
+    assert state_cache.cached_state("macro", _build, settings=s, start_date="2011-01-01") == a
+    assert len(calls) == 1
+
+    # Different start / settings are different entries; refresh always rebuilds.
+    state_cache.cached_state("macro", _build, settings=s, start_date="2020-01-01")
+    state_cache.cached_state("macro", _build, settings=_Settings("k2"), start_date="2011-01-01")
+    state_cache.cached_state("macro", _build, settings=s, start_date="2011-01-01", refresh=True)
+    assert calls[1:] == [("2020-01-01", False), ("2011-01-01", False), ("2011-01-01", True)]
+
+
+def test_build_bundle_only_builds_requested_domains(tmp_path, monkeypatch):
+    from ai_options_trader.regimes import bundle
+
+    monkeypatch.setenv("AOT_CACHE_DIR", str(tmp_path))
+    state_cache.clear_state_memo()
+
+    built: list[str] = []
+
+    def _make(name):
+        def _build(*, settings, start_date, refresh):
+            built.append(name)
+            return f"{name}@{start_date}"
+        return _build
+
+    classifiers = {"rates": str.upper}
+    monkeypatch.setattr(
+        bundle, "_builders", lambda: {d: (_make(d), classifiers.get(d)) for d in bundle.ALL_DOMAINS},
+    )
+
+    b = bundle.build_bundle(_Settings("k"), start_date="2011-01-01", domains=("macro", "funding"))
+    assert (b.macro, b.funding, b.usd) == ("macro@2011-01-01", "funding@2011-01-01", None)
+    assert sorted(built) == ["funding", "macro"]
+
+    # Full bundle reuses the cached macro/funding states.
+    full = bundle.build_bundle(_Settings("k"), start_date="2011-01-01")
+    assert full.commodities == "commodities@2011-01-01"
+    assert (full.rates, full.rates_regime) == ("rates@2011-01-01", "RATES@2011-01-01")
+    assert sorted(built) == sorted(bundle.ALL_DOMAINS)
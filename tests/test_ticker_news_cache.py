@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from ai_options_trader.llm.outlooks import ticker_news
+
+
+class _Resp:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._rows
+
+
+def test_fetch_fmp_stock_news_caches_pages(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOT_CACHE_DIR", str(tmp_path))
+    calls: list[int] = []
+
+    def _fake_get(url, params=None, timeout=None):
+        calls.append(params["page"])
+        if params["page"] > 0:
+            return _Resp([])
+        return _Resp([{"symbol": "NVDA", "title": "t", "publishedDate": "2026-01-05 14:00:00", "url": "u"}])
+
+    monkeypatch.setattr(ticker_news.requests, "get", _fake_get)
+    settings = SimpleNamespace(fmp_api_key="k")
+    kw = dict(settings=settings, tickers=["nvda"], from_date="2026-01-01", to_date="2026-01-07", max_pages=3)
+
+    a = ticker_news.fetch_fmp_stock_news(**kw)
+    # Pages are requested concurrently; only page 0 has rows.
+    assert sorted(calls) == [0, 1, 2]
+    assert [it.published_at for it in a] == ["2026-01-05T14:00:00Z"]
+
+    # The second call is served from the on-disk page cache.
+    b = ticker_news.fetch_fmp_stock_news(**kw)
+    assert a == b
+    assert len(calls) == 3